@@ -257,6 +257,13 @@ def main() -> None:
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
+    # Prefer the libuv-based event loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     # Run agent
     try:
         asyncio.run(run_agent(args.config))
@@ -19,6 +19,7 @@ from croom.security.credentials import (
 )
 from croom.security.encryption import (
     EncryptionService,
+    CipherAlgorithm,
     KeyDerivation,
     KeyDerivationAlgorithm,
     DerivedKey,
@@ -27,6 +28,7 @@ from croom.security.encryption import (
     LinuxKeyringStorage,
     TPMKeyStorage,
     create_key_storage,
+    secure_zero,
 )
 from croom.security.auth import (
     AuthenticationService,
@@ -81,6 +83,9 @@ from croom.security.api import (
     APISecurityService,
     JWTService,
     JWTConfig,
+    RevocationStore,
+    InMemoryRevocationStore,
+    RedisRevocationStore,
     TokenPayload,
     TokenType,
     RateLimiter,
@@ -111,6 +116,7 @@ __all__ = [
     "create_credential_vault",
     # Encryption
     "EncryptionService",
+    "CipherAlgorithm",
     "KeyDerivation",
     "KeyDerivationAlgorithm",
     "DerivedKey",
@@ -119,6 +125,7 @@ __all__ = [
     "LinuxKeyringStorage",
     "TPMKeyStorage",
     "create_key_storage",
+    "secure_zero",
     # Authentication
     "AuthenticationService",
     "PasswordPolicy",
@@ -167,6 +174,9 @@ __all__ = [
     "APISecurityService",
     "JWTService",
     "JWTConfig",
+    "RevocationStore",
+    "InMemoryRevocationStore",
+    "RedisRevocationStore",
     "TokenPayload",
     "TokenType",
     "RateLimiter",
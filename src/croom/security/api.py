@@ -6,20 +6,44 @@ Provides JWT authentication, rate limiting, and request validation.
 
 import base64
 import hashlib
+import heapq
 import hmac
 import json
 import logging
+import re
 import secrets
+import threading
 import time
-from collections import defaultdict
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+try:
+    # OpenSSL one-shot HMAC that hmac.digest dispatches to
+    from _hashlib import hmac_digest as _hmac_digest
+except ImportError:
+    _hmac_digest = hmac.digest
+
 logger = logging.getLogger(__name__)
 
 
+# JWT algorithm -> hashlib digest name
+HASH_NAME_MAP: Dict[str, str] = {
+    "HS256": "sha256",
+    "HS384": "sha384",
+    "HS512": "sha512",
+}
+
+# JWT algorithm -> pre-bound one-shot HMAC function (key, message) -> digest
+HMAC_FUNC_MAP: Dict[str, Callable[[bytes, bytes], bytes]] = {
+    alg: partial(_hmac_digest, digest=name) for alg, name in HASH_NAME_MAP.items()
+}
+
+
 class TokenType(Enum):
     """Types of API tokens."""
     ACCESS = "access"
@@ -106,6 +130,148 @@ class TokenPayload:
         )
 
 
+class RevocationStore(ABC):
+    """Abstract base class for token revocation backends."""
+
+    @abstractmethod
+    def is_revoked(self, jti: str) -> bool:
+        """Check whether a token ID has been revoked."""
+        pass
+
+    @abstractmethod
+    def revoke(self, jti: str, ttl: int) -> None:
+        """Revoke a token ID for ttl seconds (its remaining lifetime)."""
+        pass
+
+
+class InMemoryRevocationStore(RevocationStore):
+    """
+    Process-local revocation store.
+
+    Only suitable for single-process deployments; revocations are not
+    visible to other workers.
+    """
+
+    def __init__(self):
+        """Initialize in-memory revocation store."""
+        self._revoked: Dict[str, float] = {}  # JTI -> expiry timestamp
+        # (expiry, JTI) min-heap so expired entries are found without a scan;
+        # it may hold stale pairs for JTIs already dropped or re-revoked
+        self._expiries: List[Tuple[float, str]] = []
+
+    def is_revoked(self, jti: str) -> bool:
+        """Check whether a token ID has been revoked."""
+        expires = self._revoked.get(jti)
+        if expires is None:
+            return False
+        if expires < time.time():
+            del self._revoked[jti]
+            return False
+        return True
+
+    def revoke(self, jti: str, ttl: int) -> None:
+        """Revoke a token ID for ttl seconds."""
+        now = time.time()
+        revoked = self._revoked
+        expiries = self._expiries
+
+        # Drop entries whose tokens have expired anyway, soonest first
+        while expiries and expiries[0][0] < now:
+            expires, expired = heapq.heappop(expiries)
+            if revoked.get(expired) == expires:
+                del revoked[expired]
+
+        expires = now + ttl
+        revoked[jti] = expires
+        heapq.heappush(expiries, (expires, jti))
+
+
+class RedisRevocationStore(RevocationStore):
+    """
+    Redis-backed revocation store shared across workers.
+
+    Revocations are written as expiring keys and announced on a pub/sub
+    channel. Known revocations are remembered in a bounded local LRU, which
+    listeners on every worker update as revocations are published. Tokens
+    not known to be revoked are always checked against Redis, so a missed
+    announcement can never keep a revoked token valid.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        key_prefix: str = "croom:revoked:",
+        channel: str = "croom:revoked",
+        local_cache_size: int = 10000,
+    ):
+        """
+        Initialize Redis revocation store.
+
+        Args:
+            client: redis.Redis client instance
+            key_prefix: Prefix for revocation keys
+            channel: Pub/sub channel for revocation announcements
+            local_cache_size: Maximum revoked IDs kept in the local LRU
+        """
+        self._client = client
+        self._key_prefix = key_prefix
+        self._channel = channel
+        self._local_cache_size = local_cache_size
+        self._local: "OrderedDict[str, None]" = OrderedDict()  # Revoked JTIs
+        self._lock = threading.Lock()
+        self._listener: Optional[Any] = None
+
+    def start_listener(self) -> None:
+        """Subscribe to revocation announcements from other workers."""
+        if self._listener is not None:
+            return
+
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self._channel: self._on_message})
+        self._listener = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def stop_listener(self) -> None:
+        """Stop the pub/sub listener thread."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        """Record a revocation published by another worker."""
+        jti = message.get("data")
+        if isinstance(jti, bytes):
+            jti = jti.decode('utf-8')
+        if jti:
+            self._remember(jti)
+
+    def _remember(self, jti: str) -> None:
+        """Record a revoked token ID in the local LRU."""
+        with self._lock:
+            self._local[jti] = None
+            self._local.move_to_end(jti)
+            while len(self._local) > self._local_cache_size:
+                self._local.popitem(last=False)
+
+    def is_revoked(self, jti: str) -> bool:
+        """Check whether a token ID has been revoked."""
+        with self._lock:
+            if jti in self._local:
+                self._local.move_to_end(jti)
+                return True
+
+        # Only revocations are cached; "not revoked" may change at any time
+        revoked = bool(self._client.exists(self._key_prefix + jti))
+        if revoked:
+            self._remember(jti)
+        return revoked
+
+    def revoke(self, jti: str, ttl: int) -> None:
+        """Revoke a token ID for ttl seconds and notify other workers."""
+        self._client.set(self._key_prefix + jti, 1, ex=max(ttl, 1))
+        self._client.publish(self._channel, jti)
+        self._remember(jti)
+
+
 class JWTService:
     """
     JWT token service.
@@ -113,15 +279,26 @@ class JWTService:
     Handles token creation, validation, and refresh.
     """
 
-    def __init__(self, config: JWTConfig):
+    def __init__(
+        self,
+        config: JWTConfig,
+        revocation_store: Optional[RevocationStore] = None,
+    ):
         """
         Initialize JWT service.
 
         Args:
             config: JWT configuration
+            revocation_store: Revocation backend (in-memory by default)
         """
         self._config = config
-        self._revoked_tokens: Set[str] = set()  # JTIs of revoked tokens
+        self._revocation = revocation_store or InMemoryRevocationStore()
+
+        hmac_fn = HMAC_FUNC_MAP.get(config.algorithm)
+        if hmac_fn is None:
+            raise ValueError(f"Unsupported algorithm: {config.algorithm}")
+        self._hmac = hmac_fn
+        self._key_bytes = config.secret_key.encode('utf-8')
 
     def create_access_token(
         self,
@@ -225,7 +402,7 @@ class JWTService:
                 return None
 
             # Check revocation
-            if payload.jti in self._revoked_tokens:
+            if self._revocation.is_revoked(payload.jti):
                 logger.debug(f"Token revoked: {payload.jti}")
                 return None
 
@@ -290,7 +467,8 @@ class JWTService:
         payload = self._decode(token)
 
         if payload:
-            self._revoked_tokens.add(payload.jti)
+            ttl = int(payload.exp.timestamp() - time.time())
+            self._revocation.revoke(payload.jti, max(ttl, 1))
             return True
 
         return False
@@ -317,23 +495,23 @@ class JWTService:
         payload_b64 = self._base64url_encode(json.dumps(payload_dict))
 
         # Signature
-        message = f"{header_b64}.{payload_b64}"
-        signature = self._sign(message)
-        signature_b64 = self._base64url_encode(signature)
+        message = header_b64 + b'.' + payload_b64
+        signature_b64 = self._base64url_encode(self._sign(message))
 
-        return f"{header_b64}.{payload_b64}.{signature_b64}"
+        return (message + b'.' + signature_b64).decode('ascii')
 
     def _decode(self, token: str) -> Optional[TokenPayload]:
         """Decode and verify a JWT token."""
         try:
-            parts = token.split('.')
+            token_bytes = token.encode('ascii')
+            parts = token_bytes.split(b'.')
             if len(parts) != 3:
                 return None
 
-            header_b64, payload_b64, signature_b64 = parts
+            signature_b64 = parts[2]
 
             # Verify signature
-            message = f"{header_b64}.{payload_b64}"
+            message = token_bytes[:-len(signature_b64) - 1]
             expected_signature = self._sign(message)
             actual_signature = self._base64url_decode(signature_b64)
 
@@ -341,8 +519,7 @@ class JWTService:
                 return None
 
             # Decode payload
-            payload_json = self._base64url_decode(payload_b64).decode('utf-8')
-            payload_dict = json.loads(payload_json)
+            payload_dict = json.loads(self._base64url_decode(parts[1]))
 
             # Verify issuer and audience
             if payload_dict.get("iss") != self._config.issuer:
@@ -355,30 +532,21 @@ class JWTService:
         except Exception:
             return None
 
-    def _sign(self, message: str) -> bytes:
+    def _sign(self, message: bytes) -> bytes:
         """Sign a message using the configured algorithm."""
-        key = self._config.secret_key.encode('utf-8')
-
-        if self._config.algorithm == "HS256":
-            return hmac.new(key, message.encode('utf-8'), hashlib.sha256).digest()
-        elif self._config.algorithm == "HS384":
-            return hmac.new(key, message.encode('utf-8'), hashlib.sha384).digest()
-        elif self._config.algorithm == "HS512":
-            return hmac.new(key, message.encode('utf-8'), hashlib.sha512).digest()
-        else:
-            raise ValueError(f"Unsupported algorithm: {self._config.algorithm}")
+        return self._hmac(self._key_bytes, message)
 
-    def _base64url_encode(self, data: Any) -> str:
+    def _base64url_encode(self, data: Any) -> bytes:
         """Base64 URL encode."""
         if isinstance(data, str):
             data = data.encode('utf-8')
-        return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+        return base64.urlsafe_b64encode(data).rstrip(b'=')
 
-    def _base64url_decode(self, data: str) -> bytes:
+    def _base64url_decode(self, data: bytes) -> bytes:
         """Base64 URL decode."""
         padding = 4 - (len(data) % 4)
         if padding != 4:
-            data += '=' * padding
+            data += b'=' * padding
         return base64.urlsafe_b64decode(data)
 
 
@@ -399,6 +567,10 @@ class RateLimitConfig:
     penalty_minutes: int = 5
 
 
+# Shared result for allowed requests in RateLimiter.check
+_ALLOWED = (True, 0, 0)
+
+
 class RateLimiter:
     """
     Token bucket rate limiter.
@@ -406,6 +578,25 @@ class RateLimiter:
     Provides per-client rate limiting with burst support.
     """
 
+    # Seconds a bucket may sit idle before it is evicted
+    BUCKET_IDLE_TTL = 3600
+    # Number of checks between eviction passes
+    EVICTION_INTERVAL = 1000
+
+    # Reason codes returned by check(), indexing REASON_NAMES
+    REASON_OK = 0
+    REASON_RATE_LIMITED = 1
+    REASON_MINUTE_LIMIT = 2
+    REASON_HOUR_LIMIT = 3
+    REASON_BURST_LIMIT = 4
+    REASON_NAMES = (
+        None,
+        "rate_limited",
+        "minute_limit_exceeded",
+        "hour_limit_exceeded",
+        "burst_limit",
+    )
+
     def __init__(self, config: RateLimitConfig):
         """
         Initialize rate limiter.
@@ -414,18 +605,34 @@ class RateLimiter:
             config: Rate limit configuration
         """
         self._config = config
-        self._buckets: Dict[str, Dict[str, Any]] = defaultdict(
-            lambda: {
-                "tokens": config.burst_size,
-                "last_update": time.time(),
-                "minute_count": 0,
-                "minute_start": time.time(),
-                "hour_count": 0,
-                "hour_start": time.time(),
-                "penalty_until": 0,
-            }
-        )
+        # Least recently used first; idle buckets are evicted periodically
+        self._buckets: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._rate = config.requests_per_minute / 60  # Tokens per second
+        self._burst_retry_after = int(1 / self._rate)
+        self._checks_since_eviction = 0
+
+    def _new_bucket(self, now: float) -> Dict[str, Any]:
+        """Create a fresh bucket for a client."""
+        return {
+            "tokens": self._config.burst_size,
+            "last_update": now,
+            "minute_count": 0,
+            "minute_start": now,
+            "hour_count": 0,
+            "hour_start": now,
+            "penalty_until": 0,
+        }
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop buckets that have been idle for longer than the hour window."""
+        cutoff = now - self.BUCKET_IDLE_TTL
+        buckets = self._buckets
+
+        while buckets:
+            client_id, bucket = next(iter(buckets.items()))
+            if bucket["last_update"] >= cutoff or bucket["penalty_until"] > now:
+                break
+            del buckets[client_id]
 
     def check_limit(self, client_id: str) -> Tuple[bool, Dict[str, Any]]:
         """
@@ -437,15 +644,47 @@ class RateLimiter:
         Returns:
             Tuple of (allowed, info_dict)
         """
-        bucket = self._buckets[client_id]
+        allowed, reason, retry_after = self.check(client_id)
+
+        if allowed:
+            bucket = self._buckets[client_id]
+            return True, {
+                "remaining_minute": self._config.requests_per_minute - bucket["minute_count"],
+                "remaining_hour": self._config.requests_per_hour - bucket["hour_count"],
+            }
+
+        return False, {
+            "retry_after": retry_after,
+            "reason": self.REASON_NAMES[reason],
+        }
+
+    def check(self, client_id: str) -> Tuple[bool, int, int]:
+        """
+        Check if a request is allowed without building an info dict.
+
+        Args:
+            client_id: Client identifier (IP, user ID, API key)
+
+        Returns:
+            Tuple of (allowed, reason code, retry_after seconds)
+        """
         now = time.time()
 
+        self._checks_since_eviction += 1
+        if self._checks_since_eviction >= self.EVICTION_INTERVAL:
+            self._checks_since_eviction = 0
+            self._evict_idle(now)
+
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            bucket = self._new_bucket(now)
+            self._buckets[client_id] = bucket
+        else:
+            self._buckets.move_to_end(client_id)
+
         # Check penalty
         if now < bucket["penalty_until"]:
-            return False, {
-                "retry_after": int(bucket["penalty_until"] - now),
-                "reason": "rate_limited",
-            }
+            return False, self.REASON_RATE_LIMITED, int(bucket["penalty_until"] - now)
 
         # Refill tokens
         elapsed = now - bucket["last_update"]
@@ -468,34 +707,30 @@ class RateLimiter:
         # Check limits
         if bucket["minute_count"] >= self._config.requests_per_minute:
             bucket["penalty_until"] = now + (self._config.penalty_minutes * 60)
-            return False, {
-                "retry_after": 60 - int(now - bucket["minute_start"]),
-                "reason": "minute_limit_exceeded",
-            }
+            return (
+                False,
+                self.REASON_MINUTE_LIMIT,
+                60 - int(now - bucket["minute_start"]),
+            )
 
         if bucket["hour_count"] >= self._config.requests_per_hour:
             bucket["penalty_until"] = now + (self._config.penalty_minutes * 60)
-            return False, {
-                "retry_after": 3600 - int(now - bucket["hour_start"]),
-                "reason": "hour_limit_exceeded",
-            }
+            return (
+                False,
+                self.REASON_HOUR_LIMIT,
+                3600 - int(now - bucket["hour_start"]),
+            )
 
         # Check tokens
         if bucket["tokens"] < 1:
-            return False, {
-                "retry_after": int(1 / self._rate),
-                "reason": "burst_limit",
-            }
+            return False, self.REASON_BURST_LIMIT, self._burst_retry_after
 
         # Consume token
         bucket["tokens"] -= 1
         bucket["minute_count"] += 1
         bucket["hour_count"] += 1
 
-        return True, {
-            "remaining_minute": self._config.requests_per_minute - bucket["minute_count"],
-            "remaining_hour": self._config.requests_per_hour - bucket["hour_count"],
-        }
+        return _ALLOWED
 
     def get_limits(self, client_id: str) -> Dict[str, Any]:
         """Get current limits for a client."""
@@ -517,6 +752,30 @@ class RateLimiter:
         }
 
 
+# str.translate deletion table for null bytes and control characters
+_CONTROL_CHAR_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), 0x7f],
+    None,
+)
+
+
+# JSON schema type name -> Python type(s) for isinstance checks
+_TYPE_MAP: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+# (required fields, ((field, type, type_error, ((failed, error), ...)), ...))
+CompiledSchema = Tuple[
+    Tuple[str, ...],
+    Tuple[Tuple[str, Any, str, Tuple[Tuple[Callable[[Any], bool], str], ...]], ...],
+]
+
+
 class InputValidator:
     """
     Input validation and sanitization.
@@ -546,6 +805,8 @@ class InputValidator:
         r"%252e%252e%252f",
     ]
 
+    _EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
     @classmethod
     def validate_string(
         cls,
@@ -566,8 +827,6 @@ class InputValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        import re
-
         if len(value) > max_length:
             return False, f"Value exceeds maximum length of {max_length}"
 
@@ -602,32 +861,21 @@ class InputValidator:
             Sanitized string
         """
         import html
-        import re
-
-        # Truncate
-        value = value[:max_length]
 
-        # Remove null bytes
-        value = value.replace('\x00', '')
+        # Truncate, then drop null bytes and control characters
+        # (except newline, tab, carriage return) in a single pass
+        value = value[:max_length].translate(_CONTROL_CHAR_TABLE)
 
         # HTML escape
-        value = html.escape(value)
-
-        # Remove control characters (except newline, tab)
-        value = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', value)
-
-        return value
+        return html.escape(value)
 
     @classmethod
     def validate_email(cls, email: str) -> Tuple[bool, Optional[str]]:
         """Validate an email address."""
-        import re
-
         if len(email) > 254:
             return False, "Email too long"
 
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, email):
+        if not cls._EMAIL_RE.match(email):
             return False, "Invalid email format"
 
         return True, None
@@ -654,6 +902,84 @@ class InputValidator:
         except Exception:
             return False, "Invalid URL format"
 
+    # Compiled schemas keyed by id(); the schema itself is kept alongside
+    # so an id cannot be recycled while its entry is cached
+    _compiled_schemas: Dict[int, Tuple[Dict[str, Any], "CompiledSchema"]] = {}
+    _MAX_COMPILED_SCHEMAS = 256
+
+    @classmethod
+    def compile_schema(cls, schema: Dict[str, Any]) -> "CompiledSchema":
+        """
+        Compile a validation schema into a flat list of field checks.
+
+        Schemas are treated as immutable once compiled; the result is
+        cached per schema object and reused by validate_json.
+
+        Args:
+            schema: Validation schema
+
+        Returns:
+            Tuple of (required fields, field checks)
+        """
+        entry = cls._compiled_schemas.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            return entry[1]
+
+        fields = []
+        for field, rules in schema.get("properties", {}).items():
+            expected_type = rules.get("type")
+            py_type = _TYPE_MAP.get(expected_type, object) if expected_type else None
+            type_error = f"Field '{field}' must be of type {expected_type}"
+            checks: List[Tuple[Callable[[Any], bool], str]] = []
+
+            # String constraints
+            if expected_type == "string":
+                if "minLength" in rules:
+                    checks.append((
+                        lambda v, n=rules["minLength"]: len(v) < n,
+                        f"Field '{field}' must be at least {rules['minLength']} characters",
+                    ))
+                if "maxLength" in rules:
+                    checks.append((
+                        lambda v, n=rules["maxLength"]: len(v) > n,
+                        f"Field '{field}' must be at most {rules['maxLength']} characters",
+                    ))
+                if "pattern" in rules:
+                    checks.append((
+                        lambda v, m=re.compile(rules["pattern"]).match: not m(v),
+                        f"Field '{field}' does not match required pattern",
+                    ))
+
+            # Number constraints
+            if expected_type in ("integer", "number"):
+                if "minimum" in rules:
+                    checks.append((
+                        lambda v, n=rules["minimum"]: v < n,
+                        f"Field '{field}' must be at least {rules['minimum']}",
+                    ))
+                if "maximum" in rules:
+                    checks.append((
+                        lambda v, n=rules["maximum"]: v > n,
+                        f"Field '{field}' must be at most {rules['maximum']}",
+                    ))
+
+            # Enum
+            if "enum" in rules:
+                checks.append((
+                    lambda v, allowed=rules["enum"]: v not in allowed,
+                    f"Field '{field}' must be one of: {rules['enum']}",
+                ))
+
+            fields.append((field, py_type, type_error, tuple(checks)))
+
+        compiled = (tuple(schema.get("required", [])), tuple(fields))
+
+        if len(cls._compiled_schemas) >= cls._MAX_COMPILED_SCHEMAS:
+            cls._compiled_schemas.clear()
+        cls._compiled_schemas[id(schema)] = (schema, compiled)
+
+        return compiled
+
     @classmethod
     def validate_json(cls, data: Dict[str, Any], schema: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -666,58 +992,31 @@ class InputValidator:
         Returns:
             Tuple of (is_valid, list of errors)
         """
-        errors = []
+        required, fields = cls.compile_schema(schema)
 
         # Check required fields
-        for field in schema.get("required", []):
-            if field not in data:
-                errors.append(f"Missing required field: {field}")
+        errors = [f"Missing required field: {field}" for field in required if field not in data]
 
         # Check field types and constraints
-        for field, rules in schema.get("properties", {}).items():
+        for field, py_type, type_error, checks in fields:
             if field not in data:
                 continue
 
             value = data[field]
-            expected_type = rules.get("type")
-
-            # Type checking
-            type_map = {
-                "string": str,
-                "integer": int,
-                "number": (int, float),
-                "boolean": bool,
-                "array": list,
-                "object": dict,
-            }
 
-            if expected_type and not isinstance(value, type_map.get(expected_type, object)):
-                errors.append(f"Field '{field}' must be of type {expected_type}")
+            if py_type is not None and not isinstance(value, py_type):
+                errors.append(type_error)
                 continue
 
-            # String constraints
-            if expected_type == "string":
-                if "minLength" in rules and len(value) < rules["minLength"]:
-                    errors.append(f"Field '{field}' must be at least {rules['minLength']} characters")
-                if "maxLength" in rules and len(value) > rules["maxLength"]:
-                    errors.append(f"Field '{field}' must be at most {rules['maxLength']} characters")
-                if "pattern" in rules:
-                    import re
-                    if not re.match(rules["pattern"], value):
-                        errors.append(f"Field '{field}' does not match required pattern")
+            for failed, error in checks:
+                if failed(value):
+                    errors.append(error)
 
-            # Number constraints
-            if expected_type in ("integer", "number"):
-                if "minimum" in rules and value < rules["minimum"]:
-                    errors.append(f"Field '{field}' must be at least {rules['minimum']}")
-                if "maximum" in rules and value > rules["maximum"]:
-                    errors.append(f"Field '{field}' must be at most {rules['maximum']}")
+        return len(errors) == 0, errors
 
-            # Enum
-            if "enum" in rules and value not in rules["enum"]:
-                errors.append(f"Field '{field}' must be one of: {rules['enum']}")
 
-        return len(errors) == 0, errors
+# Length of the raw HMAC-SHA256 signature carried in CSRF tokens
+_CSRF_SIG_LEN = hashlib.sha256().digest_size
 
 
 class CSRFProtection:
@@ -750,13 +1049,12 @@ class CSRFProtection:
         """
         timestamp = int(time.time())
         random_part = secrets.token_hex(16)
-        message = f"{session_id}:{timestamp}:{random_part}"
+        message = f"{session_id}:{timestamp}:{random_part}".encode('utf-8')
 
-        signature = hmac.new(self._secret, message.encode('utf-8'), hashlib.sha256).hexdigest()
+        # Raw digest appended after the separator; no hex round-trip
+        signature = hmac.digest(self._secret, message, 'sha256')
 
-        return base64.urlsafe_b64encode(
-            f"{message}:{signature}".encode('utf-8')
-        ).decode('ascii')
+        return base64.urlsafe_b64encode(message + b':' + signature).decode('ascii')
 
     def validate_token(self, token: str, session_id: str) -> bool:
         """
@@ -770,14 +1068,15 @@ class CSRFProtection:
             True if valid
         """
         try:
-            decoded = base64.urlsafe_b64decode(token).decode('utf-8')
-            parts = decoded.rsplit(':', 1)
+            decoded = base64.urlsafe_b64decode(token)
 
-            if len(parts) != 2:
+            # Trailing raw SHA-256 digest, preceded by the ':' separator
+            if len(decoded) <= _CSRF_SIG_LEN or decoded[-_CSRF_SIG_LEN - 1] != ord(':'):
                 return False
 
-            message, signature = parts
-            msg_parts = message.split(':')
+            message = decoded[:-_CSRF_SIG_LEN - 1]
+            signature = decoded[-_CSRF_SIG_LEN:]
+            msg_parts = message.split(b':')
 
             if len(msg_parts) != 3:
                 return False
@@ -785,7 +1084,7 @@ class CSRFProtection:
             token_session, timestamp, _ = msg_parts
 
             # Verify session
-            if token_session != session_id:
+            if token_session != session_id.encode('utf-8'):
                 return False
 
             # Verify timestamp
@@ -793,11 +1092,7 @@ class CSRFProtection:
                 return False
 
             # Verify signature
-            expected_sig = hmac.new(
-                self._secret,
-                message.encode('utf-8'),
-                hashlib.sha256,
-            ).hexdigest()
+            expected_sig = hmac.digest(self._secret, message, 'sha256')
 
             return hmac.compare_digest(signature, expected_sig)
 
@@ -805,6 +1100,11 @@ class CSRFProtection:
             return False
 
 
+# Authorization header scheme prefix for bearer tokens
+_BEARER = "Bearer "
+_BEARER_LEN = len(_BEARER)
+
+
 class APISecurityService:
     """
     Main API security service.
@@ -816,6 +1116,7 @@ class APISecurityService:
         self,
         jwt_config: JWTConfig,
         rate_limit_config: Optional[RateLimitConfig] = None,
+        revocation_store: Optional[RevocationStore] = None,
     ):
         """
         Initialize API security service.
@@ -823,8 +1124,9 @@ class APISecurityService:
         Args:
             jwt_config: JWT configuration
             rate_limit_config: Rate limit configuration
+            revocation_store: Token revocation backend
         """
-        self._jwt = JWTService(jwt_config)
+        self._jwt = JWTService(jwt_config, revocation_store)
         self._rate_limiter = RateLimiter(rate_limit_config or RateLimitConfig())
         self._csrf = CSRFProtection(jwt_config.secret_key)
 
@@ -859,9 +1161,12 @@ class APISecurityService:
             Token payload if authenticated
         """
         # Try Bearer token
-        if authorization_header and authorization_header.startswith("Bearer "):
-            token = authorization_header[7:]
-            return self._jwt.validate_token(token)
+        if (
+            authorization_header is not None
+            and len(authorization_header) > _BEARER_LEN
+            and authorization_header[:_BEARER_LEN] == _BEARER
+        ):
+            return self._jwt.validate_token(authorization_header[_BEARER_LEN:])
 
         # Try API key
         if api_key_header:
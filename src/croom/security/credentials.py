@@ -4,6 +4,7 @@ Credential vault for Croom.
 Provides secure storage and management of sensitive credentials.
 """
 
+import hmac
 import json
 import logging
 import os
@@ -18,6 +19,7 @@ from typing import Any, Dict, List, Optional, Callable
 from croom.security.encryption import (
     EncryptionService,
     KeyDerivation,
+    clear_kdf_cache,
     create_key_storage,
 )
 
@@ -159,6 +161,7 @@ class CredentialVault:
         self._encryption_key = self._derive_vault_key(
             master_password,
             device_secret,
+            cached=True,
         )
         self._cipher = EncryptionService(self._encryption_key)
 
@@ -179,8 +182,14 @@ class CredentialVault:
         self,
         master_password: Optional[str],
         device_secret: Optional[bytes],
+        cached: bool = False,
     ) -> bytes:
-        """Derive the vault encryption key."""
+        """
+        Derive the vault encryption key.
+
+        Only opening the vault may pass cached=True; password checks must
+        always pay the full KDF cost.
+        """
         # Load or create salt
         salt_path = self._vault_path / ".salt"
 
@@ -207,8 +216,11 @@ class CredentialVault:
         if device_id:
             password = password + device_id.encode('utf-8')
 
-        # Derive key
-        derived = KeyDerivation.derive_argon2(password, salt)
+        # Derive key; reopening the same vault reuses the unlocked key
+        if cached:
+            derived = KeyDerivation.derive_key_cached(password, salt)
+        else:
+            derived = KeyDerivation.derive_argon2(password, salt)
         return derived.key
 
     def _get_device_id(self) -> Optional[str]:
@@ -585,7 +597,7 @@ class CredentialVault:
         """
         # Verify old password
         old_key = self._derive_vault_key(old_password, None)
-        if old_key != self._encryption_key:
+        if not hmac.compare_digest(old_key, self._encryption_key):
             logger.error("Invalid old password")
             return False
 
@@ -627,6 +639,9 @@ class CredentialVault:
             with open(salt_path, 'wb') as f:
                 f.write(new_salt)
 
+            # Drop this vault's cached key for the old password
+            clear_kdf_cache(self._encryption_key)
+
             # Update cipher and key
             self._encryption_key = derived.key
             self._cipher = new_cipher
@@ -2,20 +2,77 @@
 Encryption services for Croom.
 
 Provides AES-256-GCM encryption with secure key derivation.
+
+Requires the cryptography package (>= 3.0), whose OpenSSL backend uses
+AES-NI and carry-less multiply for GCM where the CPU supports them.
 """
 
 import base64
+import ctypes
+import functools
 import hashlib
 import hmac
+import inspect
 import logging
+import mmap
 import os
 import secrets
-import struct
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar, Union
+
+try:
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    InvalidTag = None
+    AESGCM = ChaCha20Poly1305 = None
+    hashes = PBKDF2HMAC = Scrypt = None
+    CRYPTOGRAPHY_AVAILABLE = False
+
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCMSIV
+except ImportError:
+    AESGCMSIV = None  # cryptography < 42
+
+
+def _cryptography_pbkdf2_hmac(
+    hash_name: str,
+    password: bytes,
+    salt: bytes,
+    iterations: int,
+    dklen: Optional[int] = None,
+) -> bytes:
+    """hashlib.pbkdf2_hmac equivalent backed by cryptography's PBKDF2HMAC."""
+    algorithm = getattr(hashes, hash_name.upper())()
+    return PBKDF2HMAC(
+        algorithm=algorithm,
+        length=dklen or algorithm.digest_size,
+        salt=salt,
+        iterations=iterations,
+    ).derive(password)
+
+
+# PBKDF2 backend preference: fastpbkdf2, then cryptography's binding of
+# OpenSSL's PKCS5_PBKDF2_HMAC, then hashlib
+try:
+    from fastpbkdf2 import pbkdf2_hmac as _pbkdf2_hmac
+    FASTPBKDF2_AVAILABLE = True
+except ImportError:
+    if CRYPTOGRAPHY_AVAILABLE:
+        _pbkdf2_hmac = _cryptography_pbkdf2_hmac
+    else:
+        _pbkdf2_hmac = hashlib.pbkdf2_hmac
+    FASTPBKDF2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +82,122 @@ NONCE_SIZE = 12
 TAG_SIZE = 16
 KEY_SIZE = 32  # 256 bits
 ITERATION_COUNT = 600000  # OWASP recommended for PBKDF2-SHA256
+ARGON2_MAX_LANES = 8  # Upper bound for auto-detected Argon2 parallelism
+NONCE_POOL_SIZE = (4096 // NONCE_SIZE) * NONCE_SIZE  # Random bytes per refill
+MMAP_THRESHOLD = 64 * 1024  # Map larger key files instead of reading them
+
+
+# CPU feature flags OpenSSL uses for AES, GHASH and SHA-256, as named in
+# /proc/cpuinfo on x86 ("flags") and ARM ("Features")
+_ACCELERATION_FLAGS = {
+    "aes": ("aes",),
+    "ghash": ("pclmulqdq", "pmull"),
+    "sha256": ("sha_ni", "sha2"),
+}
+
+# Probe result, computed once per process
+_acceleration: Optional[Dict[str, bool]] = None
+
+# Bound once for the nonce hot path; getrandom(2) backs both this and secrets
+_urandom = os.urandom
+
+# Bumped in forked children so inherited nonce pools are never reused
+_fork_generation = 0
+
+
+def _after_fork_in_child() -> None:
+    global _fork_generation
+    _fork_generation += 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _read_cpu_flags() -> Optional[Set[str]]:
+    """Read CPU feature flags, or None if they cannot be determined."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith(("flags", "Features")):
+                    return set(line.split(":", 1)[1].split())
+    except Exception:
+        pass
+    return None
+
+
+def _probe_acceleration() -> Dict[str, bool]:
+    """
+    Check whether AES-GCM and SHA-256 can use hardware acceleration.
+
+    Logs a warning once per process when a feature is missing or masked
+    via OPENSSL_ia32cap, so software-only crypto is visible to operators.
+
+    Returns:
+        Mapping of feature name to availability (empty if unknown)
+    """
+    global _acceleration
+    if _acceleration is not None:
+        return _acceleration
+
+    flags = _read_cpu_flags()
+    if flags is None:
+        _acceleration = {}
+        return _acceleration
+
+    _acceleration = {
+        feature: any(name in flags for name in names)
+        for feature, names in _ACCELERATION_FLAGS.items()
+    }
+
+    missing = [feature for feature, present in _acceleration.items() if not present]
+    if missing:
+        logger.warning(
+            f"CPU lacks crypto acceleration for {', '.join(missing)}; "
+            "AES-GCM and PBKDF2 will run in software"
+        )
+
+    if os.environ.get("OPENSSL_ia32cap"):
+        logger.warning("OPENSSL_ia32cap is set; OpenSSL CPU features may be masked")
+
+    if CRYPTOGRAPHY_AVAILABLE:
+        from cryptography.hazmat.backends.openssl.backend import backend
+        logger.debug(f"Crypto backend: {backend.openssl_version_text()}")
+
+    return _acceleration
+
+
+def _is_rotational(path: Path) -> bool:
+    """
+    Check whether a path lives on a rotational (spinning) disk.
+
+    Unknown devices count as rotational so callers stay conservative.
+    """
+    try:
+        dev = os.stat(path).st_dev
+        device_dir = os.path.realpath(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}")
+        # Partitions keep their queue settings on the parent disk
+        for candidate in (device_dir, os.path.dirname(device_dir)):
+            flag_path = os.path.join(candidate, "queue", "rotational")
+            if os.path.exists(flag_path):
+                with open(flag_path) as f:
+                    return f.read().strip() == "1"
+    except Exception:
+        pass
+    return True
+
+
+def secure_zero(buffer: bytearray) -> None:
+    """Overwrite a mutable buffer holding key material with zeros."""
+    if buffer:
+        ctypes.memset((ctypes.c_char * len(buffer)).from_buffer(buffer), 0, len(buffer))
+
+
+class CipherAlgorithm(Enum):
+    """AEAD ciphers; all use 256-bit keys, 96-bit nonces and 128-bit tags."""
+    AES_GCM = "aes-gcm"
+    CHACHA20_POLY1305 = "chacha20-poly1305"
+    AES_GCM_SIV = "aes-gcm-siv"
 
 
 class KeyDerivationAlgorithm(Enum):
@@ -59,6 +232,65 @@ class DerivedKey:
         )
 
 
+# Recently derived keys for KeyDerivation.derive_key_cached(), so unlocking
+# the same key store again skips the KDF. Entries are keyed by a per-process
+# keyed hash; raw passwords are never stored.
+KDF_CACHE_SIZE = 16
+_kdf_cache: "OrderedDict[bytes, DerivedKey]" = OrderedDict()
+_kdf_cache_lock = threading.Lock()
+_kdf_cache_secret = secrets.token_bytes(32)
+
+F = TypeVar("F", bound=Callable[..., DerivedKey])
+
+
+def _cache_derived(func: F) -> F:
+    """Memoize a KDF on (password, salt, parameters) when a salt is given."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> DerivedKey:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+
+        # A fresh random salt can never produce a cache hit
+        salt = arguments["salt"]
+        if salt is None:
+            return func(*args, **kwargs)
+
+        password = arguments["password"]
+        if isinstance(password, str):
+            password = password.encode('utf-8')
+        params = repr([func.__name__] + [
+            (name, value) for name, value in arguments.items()
+            if name not in ("password", "salt")
+        ]).encode()
+
+        hasher = hashlib.blake2b(key=_kdf_cache_secret, digest_size=32)
+        for part in (password, salt, params):
+            hasher.update(len(part).to_bytes(8, "big"))
+            hasher.update(part)
+        cache_key = hasher.digest()
+        del password
+
+        with _kdf_cache_lock:
+            cached = _kdf_cache.get(cache_key)
+            if cached is not None:
+                _kdf_cache.move_to_end(cache_key)
+                return replace(cached)
+
+        derived = func(*args, **kwargs)
+
+        with _kdf_cache_lock:
+            _kdf_cache[cache_key] = replace(derived)
+            while len(_kdf_cache) > KDF_CACHE_SIZE:
+                _kdf_cache.popitem(last=False)
+
+        return derived
+
+    return wrapper  # type: ignore[return-value]
+
+
 class KeyDerivation:
     """
     Secure key derivation from passwords/secrets.
@@ -66,6 +298,31 @@ class KeyDerivation:
     Supports multiple KDF algorithms for flexibility.
     """
 
+    @staticmethod
+    def derive_key_cached(
+        password: Union[str, bytes],
+        salt: bytes,
+        algorithm: KeyDerivationAlgorithm = KeyDerivationAlgorithm.ARGON2ID,
+        **params: Any,
+    ) -> DerivedKey:
+        """
+        Derive a key, reusing a recent result for the same inputs.
+
+        Only for unlocking a key store with a persistent salt. Never use it
+        to verify passwords: cached keys stay in process memory and a cache
+        hit is measurably faster than a real derivation.
+
+        Args:
+            password: Password or secret to derive from
+            salt: The store's persistent salt
+            algorithm: KDF algorithm to use
+            **params: Algorithm-specific cost parameters
+
+        Returns:
+            DerivedKey with key material and metadata
+        """
+        return _CACHED_KDFS[algorithm](password, salt, **params)
+
     @staticmethod
     def derive_pbkdf2(
         password: Union[str, bytes],
@@ -89,7 +346,7 @@ class KeyDerivation:
         if salt is None:
             salt = secrets.token_bytes(SALT_SIZE)
 
-        key = hashlib.pbkdf2_hmac(
+        key = _pbkdf2_hmac(
             'sha256',
             password,
             salt,
@@ -110,7 +367,7 @@ class KeyDerivation:
         salt: Optional[bytes] = None,
         time_cost: int = 3,
         memory_cost: int = 65536,
-        parallelism: int = 4,
+        parallelism: Optional[int] = 4,
     ) -> DerivedKey:
         """
         Derive a key using Argon2id.
@@ -120,7 +377,10 @@ class KeyDerivation:
             salt: Optional salt (generated if not provided)
             time_cost: Number of iterations
             memory_cost: Memory in KB
-            parallelism: Degree of parallelism
+            parallelism: Degree of parallelism, or None to use one lane per
+                CPU (up to ARGON2_MAX_LANES). More lanes keep wall-clock
+                time flat while raising attacker cost, but the lane count
+                is part of the derivation, so re-derive with the same value.
 
         Returns:
             DerivedKey with key material and metadata
@@ -137,6 +397,9 @@ class KeyDerivation:
         if salt is None:
             salt = secrets.token_bytes(SALT_SIZE)
 
+        if parallelism is None:
+            parallelism = min(os.cpu_count() or 1, ARGON2_MAX_LANES)
+
         key = hash_secret_raw(
             secret=password,
             salt=salt,
@@ -181,14 +444,19 @@ class KeyDerivation:
         if salt is None:
             salt = secrets.token_bytes(SALT_SIZE)
 
-        key = hashlib.scrypt(
-            password,
-            salt=salt,
-            n=n,
-            r=r,
-            p=p,
-            dklen=KEY_SIZE,
-        )
+        if CRYPTOGRAPHY_AVAILABLE:
+            key = Scrypt(salt=salt, length=KEY_SIZE, n=n, r=r, p=p).derive(password)
+        else:
+            key = hashlib.scrypt(
+                password,
+                salt=salt,
+                n=n,
+                r=r,
+                p=p,
+                # OpenSSL's 32 MiB default rejects the n=2**17 default cost
+                maxmem=128 * r * (n + p + 2),
+                dklen=KEY_SIZE,
+            )
 
         return DerivedKey(
             key=key,
@@ -198,19 +466,52 @@ class KeyDerivation:
         )
 
 
+_CACHED_KDFS: Dict[KeyDerivationAlgorithm, Callable[..., DerivedKey]] = {
+    KeyDerivationAlgorithm.PBKDF2_SHA256: _cache_derived(KeyDerivation.derive_pbkdf2),
+    KeyDerivationAlgorithm.ARGON2ID: _cache_derived(KeyDerivation.derive_argon2),
+    KeyDerivationAlgorithm.SCRYPT: _cache_derived(KeyDerivation.derive_scrypt),
+}
+
+
+def clear_kdf_cache(key: Optional[bytes] = None) -> None:
+    """
+    Forget keys cached by KeyDerivation.derive_key_cached().
+
+    Args:
+        key: Only evict entries holding this derived key; all when omitted
+    """
+    with _kdf_cache_lock:
+        if key is None:
+            _kdf_cache.clear()
+            return
+        for cache_key in [
+            k for k, derived in _kdf_cache.items()
+            if hmac.compare_digest(derived.key, key)
+        ]:
+            del _kdf_cache[cache_key]
+
+
 class EncryptionService:
     """
     AES-256-GCM encryption service.
 
     Provides authenticated encryption with associated data (AEAD).
+    ChaCha20-Poly1305 and AES-GCM-SIV can be selected instead; data must
+    be decrypted with the algorithm it was encrypted with.
     """
 
-    def __init__(self, key: Optional[bytes] = None):
+    def __init__(
+        self,
+        key: Optional[bytes] = None,
+        algorithm: Optional[CipherAlgorithm] = CipherAlgorithm.AES_GCM,
+    ):
         """
         Initialize encryption service.
 
         Args:
             key: 256-bit encryption key (generated if not provided)
+            algorithm: AEAD cipher, or None to pick ChaCha20-Poly1305 on
+                CPUs without GHASH acceleration and AES-GCM otherwise
         """
         if key is None:
             key = secrets.token_bytes(KEY_SIZE)
@@ -218,22 +519,65 @@ class EncryptionService:
         if len(key) != KEY_SIZE:
             raise ValueError(f"Key must be {KEY_SIZE} bytes")
 
-        self._key = key
-        self._cipher_available = self._check_cipher_availability()
+        if not CRYPTOGRAPHY_AVAILABLE:
+            raise RuntimeError("cryptography not installed")
 
-    def _check_cipher_availability(self) -> bool:
-        """Check if cryptography library is available."""
-        try:
-            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-            return True
-        except ImportError:
-            logger.warning("cryptography library not available")
-            return False
+        acceleration = _probe_acceleration()
+        if algorithm is None:
+            if acceleration.get("ghash", True):
+                algorithm = CipherAlgorithm.AES_GCM
+            else:
+                algorithm = CipherAlgorithm.CHACHA20_POLY1305
+
+        if algorithm == CipherAlgorithm.AES_GCM_SIV and AESGCMSIV is None:
+            raise RuntimeError("AES-GCM-SIV requires cryptography >= 42")
+
+        # Held in a mutable buffer so it can be wiped when the service dies
+        self._key = bytearray(key)
+        self._algorithm = algorithm
+
+        # Key schedule is computed once and reused for every operation
+        if algorithm == CipherAlgorithm.CHACHA20_POLY1305:
+            self._aead = ChaCha20Poly1305(key)
+        elif algorithm == CipherAlgorithm.AES_GCM_SIV:
+            self._aead = AESGCMSIV(key)
+        else:
+            self._aead = AESGCM(key)
+
+        # Random nonces are drawn from a pool refilled by one urandom call
+        self._nonce_pool = b""
+        self._nonce_offset = 0
+        self._nonce_generation = _fork_generation
+        self._nonce_lock = threading.Lock()
+
+    def __del__(self):
+        key = getattr(self, "_key", None)
+        if key is not None:
+            secure_zero(key)
 
     @property
     def key(self) -> bytes:
         """Get the encryption key."""
-        return self._key
+        return bytes(self._key)
+
+    @property
+    def algorithm(self) -> CipherAlgorithm:
+        """Get the AEAD cipher in use."""
+        return self._algorithm
+
+    def _next_nonce(self) -> bytes:
+        """Take the next random nonce from the pool, refilling it as needed."""
+        with self._nonce_lock:
+            offset = self._nonce_offset
+            if (
+                offset + NONCE_SIZE > len(self._nonce_pool)
+                or self._nonce_generation != _fork_generation
+            ):
+                self._nonce_pool = _urandom(NONCE_POOL_SIZE)
+                self._nonce_generation = _fork_generation
+                offset = 0
+            self._nonce_offset = offset + NONCE_SIZE
+            return self._nonce_pool[offset:offset + NONCE_SIZE]
 
     def encrypt(
         self,
@@ -241,7 +585,7 @@ class EncryptionService:
         associated_data: Optional[bytes] = None,
     ) -> bytes:
         """
-        Encrypt data using AES-256-GCM.
+        Encrypt data using the configured AEAD cipher.
 
         Args:
             plaintext: Data to encrypt
@@ -253,15 +597,8 @@ class EncryptionService:
         if isinstance(plaintext, str):
             plaintext = plaintext.encode('utf-8')
 
-        if not self._cipher_available:
-            return self._encrypt_fallback(plaintext, associated_data)
-
-        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-
-        nonce = secrets.token_bytes(NONCE_SIZE)
-        aesgcm = AESGCM(self._key)
-
-        ciphertext = aesgcm.encrypt(nonce, plaintext, associated_data)
+        nonce = self._next_nonce()
+        ciphertext = self._aead.encrypt(nonce, plaintext, associated_data)
 
         # Format: nonce || ciphertext (includes tag)
         return nonce + ciphertext
@@ -272,7 +609,7 @@ class EncryptionService:
         associated_data: Optional[bytes] = None,
     ) -> bytes:
         """
-        Decrypt data using AES-256-GCM.
+        Decrypt data using the configured AEAD cipher.
 
         Args:
             ciphertext: Encrypted data (nonce || ciphertext || tag)
@@ -287,49 +624,16 @@ class EncryptionService:
         if len(ciphertext) < NONCE_SIZE + TAG_SIZE:
             raise ValueError("Ciphertext too short")
 
-        if not self._cipher_available:
-            return self._decrypt_fallback(ciphertext, associated_data)
-
-        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-        from cryptography.exceptions import InvalidTag
-
-        nonce = ciphertext[:NONCE_SIZE]
-        actual_ciphertext = ciphertext[NONCE_SIZE:]
-
-        aesgcm = AESGCM(self._key)
+        # Slice through a memoryview so the ciphertext is not copied
+        view = memoryview(ciphertext)
+        nonce = view[:NONCE_SIZE]
+        actual_ciphertext = view[NONCE_SIZE:]
 
         try:
-            return aesgcm.decrypt(nonce, actual_ciphertext, associated_data)
+            return self._aead.decrypt(nonce, actual_ciphertext, associated_data)
         except InvalidTag:
             raise ValueError("Decryption failed: invalid tag or corrupted data")
 
-    def _encrypt_fallback(
-        self,
-        plaintext: bytes,
-        associated_data: Optional[bytes],
-    ) -> bytes:
-        """Fallback encryption using Fernet (less secure but available in stdlib)."""
-        from cryptography.fernet import Fernet
-
-        # Derive Fernet key from our key
-        fernet_key = base64.urlsafe_b64encode(self._key)
-        f = Fernet(fernet_key)
-
-        return f.encrypt(plaintext)
-
-    def _decrypt_fallback(
-        self,
-        ciphertext: bytes,
-        associated_data: Optional[bytes],
-    ) -> bytes:
-        """Fallback decryption using Fernet."""
-        from cryptography.fernet import Fernet
-
-        fernet_key = base64.urlsafe_b64encode(self._key)
-        f = Fernet(fernet_key)
-
-        return f.decrypt(ciphertext)
-
     def encrypt_to_base64(
         self,
         plaintext: Union[str, bytes],
@@ -396,6 +700,15 @@ class SecureKeyStorage(ABC):
         """Delete a stored key."""
         pass
 
+    def retrieve_keys(self, key_ids: List[str]) -> Dict[str, bytes]:
+        """Retrieve several keys; missing or unreadable keys are omitted."""
+        keys = {}
+        for key_id in key_ids:
+            key = self.retrieve_key(key_id)
+            if key is not None:
+                keys[key_id] = key
+        return keys
+
     @abstractmethod
     def key_exists(self, key_id: str) -> bool:
         """Check if a key exists."""
@@ -427,17 +740,32 @@ class FileKeyStorage(SecureKeyStorage):
         except OSError:
             logger.warning("Could not set permissions on key storage directory")
 
+        # Overwriting before unlink only reaches the old sectors on spinning
+        # disks; SSD wear levelling writes the new data elsewhere
+        self._overwrite_on_delete = _is_rotational(self._storage_path)
+
     def _key_path(self, key_id: str) -> Path:
         """Get path for a key file."""
-        # Sanitize key_id to prevent directory traversal
-        safe_id = hashlib.sha256(key_id.encode()).hexdigest()
+        # Sanitize key_id to prevent directory traversal; the hash only
+        # needs to be collision-free, not a security boundary
+        safe_id = hashlib.blake2b(key_id.encode(), digest_size=16).hexdigest()
         return self._storage_path / f"{safe_id}.key"
 
+    def _resolve_key_path(self, key_id: str) -> Path:
+        """Get path for a key file, migrating one stored under the old name."""
+        key_path = self._key_path(key_id)
+        if not key_path.exists():
+            legacy_id = hashlib.sha256(key_id.encode()).hexdigest()
+            legacy_path = self._storage_path / f"{legacy_id}.key"
+            if legacy_path.exists():
+                os.replace(legacy_path, key_path)
+        return key_path
+
     def store_key(self, key_id: str, key: bytes) -> bool:
         """Store a key securely."""
         try:
             encrypted = self._cipher.encrypt(key)
-            key_path = self._key_path(key_id)
+            key_path = self._resolve_key_path(key_id)
 
             with open(key_path, 'wb') as f:
                 f.write(encrypted)
@@ -455,29 +783,49 @@ class FileKeyStorage(SecureKeyStorage):
     def retrieve_key(self, key_id: str) -> Optional[bytes]:
         """Retrieve a stored key."""
         try:
-            key_path = self._key_path(key_id)
+            key_path = self._resolve_key_path(key_id)
 
             if not key_path.exists():
                 return None
 
             with open(key_path, 'rb') as f:
-                encrypted = f.read()
+                if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                    return self._cipher.decrypt(f.read())
 
-            return self._cipher.decrypt(encrypted)
+                # Decrypt straight from the page cache for large entries
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return self._cipher.decrypt(mapped)
 
         except Exception as e:
             logger.error(f"Failed to retrieve key {key_id}: {e}")
             return None
 
+    def retrieve_keys(self, key_ids: List[str]) -> Dict[str, bytes]:
+        """Retrieve several keys, reading and decrypting them in parallel."""
+        if len(key_ids) <= 1:
+            return super().retrieve_keys(key_ids)
+
+        # File reads and AES-GCM both release the GIL
+        workers = min(len(key_ids), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(self.retrieve_key, key_ids))
+
+        return {
+            key_id: key
+            for key_id, key in zip(key_ids, results)
+            if key is not None
+        }
+
     def delete_key(self, key_id: str) -> bool:
         """Delete a stored key."""
         try:
-            key_path = self._key_path(key_id)
+            key_path = self._resolve_key_path(key_id)
 
             if key_path.exists():
-                # Overwrite with random data before deletion
-                with open(key_path, 'wb') as f:
-                    f.write(secrets.token_bytes(256))
+                if self._overwrite_on_delete:
+                    # Overwrite with random data before deletion
+                    with open(key_path, 'wb') as f:
+                        f.write(secrets.token_bytes(256))
                 key_path.unlink()
 
             logger.debug(f"Deleted key: {key_id}")
@@ -489,7 +837,7 @@ class FileKeyStorage(SecureKeyStorage):
 
     def key_exists(self, key_id: str) -> bool:
         """Check if a key exists."""
-        return self._key_path(key_id).exists()
+        return self._resolve_key_path(key_id).exists()
 
 
 class LinuxKeyringStorage(SecureKeyStorage):
@@ -529,19 +877,18 @@ class LinuxKeyringStorage(SecureKeyStorage):
             connection = secretstorage.dbus_init()
             collection = secretstorage.get_default_collection(connection)
 
-            # Encode key as base64 for storage
-            key_b64 = base64.b64encode(key).decode('ascii')
-
             attributes = {
                 "service": self._service_name,
                 "key_id": key_id,
             }
 
+            # Secret Service stores arbitrary bytes; no need to base64 them
             collection.create_item(
                 f"{self._service_name}/{key_id}",
                 attributes,
-                key_b64.encode('utf-8'),
+                key,
                 replace=True,
+                content_type="application/octet-stream",
             )
 
             logger.debug(f"Stored key in keyring: {key_id}")
@@ -572,8 +919,13 @@ class LinuxKeyringStorage(SecureKeyStorage):
             if not items:
                 return None
 
-            key_b64 = items[0].get_secret().decode('utf-8')
-            return base64.b64decode(key_b64)
+            item = items[0]
+            secret = item.get_secret()
+
+            # Items written by older releases hold base64 text
+            if item.get_secret_content_type() == "application/octet-stream":
+                return secret
+            return base64.b64decode(secret)
 
         except Exception as e:
             logger.error(f"Failed to retrieve key from keyring: {e}")
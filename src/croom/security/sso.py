@@ -4,22 +4,94 @@ Single Sign-On (SSO) providers for Croom.
 Supports SAML 2.0, OIDC/OAuth 2.0, and LDAP authentication.
 """
 
+import asyncio
 import base64
 import hashlib
 import json
 import logging
 import secrets
+import threading
 import time
 import urllib.parse
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 import xml.etree.ElementTree as ET
 
+try:
+    from isal import isal_zlib as _zlib
+    ISAL_AVAILABLE = True
+    # ISA-L supports levels 0-3; 1 is its fastest general-purpose level
+    _DEFLATE_LEVEL = 1
+except ImportError:
+    import zlib as _zlib
+    ISAL_AVAILABLE = False
+    _DEFLATE_LEVEL = 9
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import ldap3
+    LDAP3_AVAILABLE = True
+except ImportError:
+    ldap3 = None
+    LDAP3_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    from lxml import etree as LET
+    LXML_AVAILABLE = True
+except ImportError:
+    LET = None
+    LXML_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Logins that were started but never completed are forgotten after this
+# many seconds, and at most this many are tracked per authenticator
+PENDING_LOGIN_TTL = 10 * 60
+MAX_PENDING_LOGINS = 10000
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode data as compact UTF-8 JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _NoDoctypeTreeBuilder(ET.TreeBuilder):
+    """
+    ElementTree builder that rejects documents declaring a DTD.
+
+    SAML messages never carry a DOCTYPE. The parser reports the
+    declaration before any entity in the body is expanded, so raising here
+    stops entity-expansion and external-entity attacks up front.
+    """
+
+    def doctype(self, name: str, pubid: Optional[str], system: Optional[str]) -> None:
+        raise ValueError("DTDs are not allowed in SAML messages")
+
 
 class SSOProvider(Enum):
     """Supported SSO providers."""
@@ -31,7 +103,7 @@ class SSOProvider(Enum):
     GOOGLE = "google"
 
 
-@dataclass
+@dataclass(slots=True)
 class SSOUser:
     """
     User information from SSO authentication.
@@ -74,6 +146,53 @@ class SSOUser:
         }
 
 
+class _PendingLogins:
+    """
+    Bounded, insertion-ordered store of logins awaiting a callback.
+
+    Entries are evicted oldest-first once they exceed the TTL or the
+    store exceeds its size limit, so abandoned logins cannot accumulate.
+    """
+
+    def __init__(
+        self,
+        max_size: int = MAX_PENDING_LOGINS,
+        ttl: int = PENDING_LOGIN_TTL,
+    ):
+        # Creation times are monotonic nanoseconds, so expiry is an integer
+        # comparison that wall-clock changes cannot disturb
+        self._entries: "OrderedDict[str, Tuple[int, Any]]" = OrderedDict()
+        self._max_size = max_size
+        self._ttl_ns = ttl * 1_000_000_000
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def add(self, key: str, value: Any = None) -> None:
+        """Record a pending login, evicting expired or excess entries."""
+        now = time.monotonic_ns()
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+
+        entries = self._entries
+        while entries:
+            created, _ = next(iter(entries.values()))
+            if len(entries) <= self._max_size and now - created <= self._ttl_ns:
+                break
+            entries.popitem(last=False)
+
+    def pop(self, key: str) -> Optional[Tuple[int, Any]]:
+        """Remove a pending login, returning its creation time and value."""
+        return self._entries.pop(key, None)
+
+    def is_expired(self, created: int) -> bool:
+        """Check whether an entry created at the given time has expired."""
+        return time.monotonic_ns() - created > self._ttl_ns
+
+
 class SSOAuthenticator(ABC):
     """Abstract base class for SSO authenticators."""
 
@@ -92,6 +211,10 @@ class SSOAuthenticator(ABC):
         """Get the URL for logout."""
         pass
 
+    async def aclose(self) -> None:
+        """Release any connections held by the authenticator."""
+        pass
+
 
 @dataclass
 class SAMLConfig:
@@ -143,6 +266,37 @@ class SAMLAuthenticator(SSOAuthenticator):
         "ds": "http://www.w3.org/2000/09/xmldsig#",
     }
 
+    # Clark-notation tags, so ElementTree lookups skip prefix resolution
+    _NS_SAML = "urn:oasis:names:tc:SAML:2.0:assertion"
+    _NS_SAMLP = "urn:oasis:names:tc:SAML:2.0:protocol"
+    _NS_DS = "http://www.w3.org/2000/09/xmldsig#"
+    TAG_STATUS_CODE = f"{{{_NS_SAMLP}}}StatusCode"
+    TAG_ASSERTION = f"{{{_NS_SAML}}}Assertion"
+    TAG_SIGNATURE = f"{{{_NS_DS}}}Signature"
+    TAG_NAMEID = f"{{{_NS_SAML}}}NameID"
+    TAG_ATTRIBUTE = f"{{{_NS_SAML}}}Attribute"
+    TAG_ATTRIBUTE_VALUE = f"{{{_NS_SAML}}}AttributeValue"
+
+    if LXML_AVAILABLE:
+        # Entities and network access are disabled so a hostile response
+        # cannot expand or fetch external content during parsing. Comments
+        # and processing instructions are dropped so text split around them
+        # (e.g. "admin@corp.com<!---->.evil.com") reads as one value, as
+        # with ElementTree, instead of stopping at the first comment.
+        _XML_PARSER = LET.XMLParser(
+            resolve_entities=False,
+            no_network=True,
+            huge_tree=False,
+            remove_comments=True,
+            remove_pis=True,
+        )
+        _xp_status = LET.XPath(".//samlp:StatusCode", namespaces=SAML_NS)
+        _xp_assertion = LET.XPath(".//saml:Assertion", namespaces=SAML_NS)
+        _xp_signature = LET.XPath(".//ds:Signature", namespaces=SAML_NS)
+    else:
+        _XML_PARSER = None
+        _xp_status = _xp_assertion = _xp_signature = None
+
     def __init__(self, config: SAMLConfig):
         """
         Initialize SAML authenticator.
@@ -151,7 +305,12 @@ class SAMLAuthenticator(SSOAuthenticator):
             config: SAML configuration
         """
         self._config = config
-        self._pending_requests: Dict[str, datetime] = {}
+        self._pending_requests = _PendingLogins()
+
+        # Only the request ID and IssueInstant vary per AuthnRequest, so
+        # the static XML around them is rendered once
+        self._authn_request_parts = self._render_authn_request_parts()
+        self._metadata_xml = self._render_metadata()
 
     def get_login_url(self, state: Optional[str] = None) -> str:
         """
@@ -164,15 +323,15 @@ class SAMLAuthenticator(SSOAuthenticator):
             Login redirect URL
         """
         # Generate request ID
-        request_id = f"_{''.join(secrets.token_hex(16))}"
-        self._pending_requests[request_id] = datetime.utcnow()
+        request_id = f"_{secrets.token_hex(16)}"
+        self._pending_requests.add(request_id)
 
         # Build AuthnRequest
         request_xml = self._build_authn_request(request_id)
 
-        # Encode and compress
-        import zlib
-        compressed = zlib.compress(request_xml.encode('utf-8'))[2:-4]  # Remove zlib header/checksum
+        # Encode and compress as raw DEFLATE (no zlib header/checksum)
+        compressor = _zlib.compressobj(level=_DEFLATE_LEVEL, wbits=-15)
+        compressed = compressor.compress(request_xml.encode('utf-8')) + compressor.flush()
         encoded = base64.b64encode(compressed).decode('ascii')
 
         # Build URL
@@ -184,17 +343,17 @@ class SAMLAuthenticator(SSOAuthenticator):
 
         return f"{self._config.sso_url}?{urllib.parse.urlencode(params)}"
 
-    def _build_authn_request(self, request_id: str) -> str:
-        """Build SAML AuthnRequest XML."""
-        now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
+    def _render_authn_request_parts(self) -> Tuple[str, str, str]:
+        """Render the static AuthnRequest XML around ID and IssueInstant."""
+        head = '''<?xml version="1.0" encoding="UTF-8"?>
 <samlp:AuthnRequest
     xmlns:samlp="urn:oasis:names:tc:SAML:2.0:protocol"
     xmlns:saml="urn:oasis:names:tc:SAML:2.0:assertion"
-    ID="{request_id}"
+    ID="'''
+        middle = '''"
     Version="2.0"
-    IssueInstant="{now}"
+    IssueInstant="'''
+        tail = f'''"
     Destination="{self._config.sso_url}"
     AssertionConsumerServiceURL="{self._config.acs_url}"
     ProtocolBinding="urn:oasis:names:tc:SAML:2.0:bindings:HTTP-POST">
@@ -202,7 +361,15 @@ class SAMLAuthenticator(SSOAuthenticator):
     <samlp:NameIDPolicy
         Format="{self._config.name_id_format}"
         AllowCreate="true"/>
-</samlp:AuthnRequest>"""
+</samlp:AuthnRequest>'''
+        return head, middle, tail
+
+    def _build_authn_request(self, request_id: str) -> str:
+        """Build SAML AuthnRequest XML."""
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        head, middle, tail = self._authn_request_parts
+
+        return "".join((head, request_id, middle, now, tail))
 
     async def process_callback(self, data: Dict[str, Any]) -> Optional[SSOUser]:
         """
@@ -220,14 +387,12 @@ class SAMLAuthenticator(SSOAuthenticator):
             return None
 
         try:
-            # Decode response
-            response_xml = base64.b64decode(saml_response).decode('utf-8')
-
-            # Parse XML
-            root = ET.fromstring(response_xml)
+            # Decode and parse; the parser detects the encoding from the
+            # XML declaration, so the bytes are not decoded first
+            root = self._parse_response(base64.b64decode(saml_response))
 
             # Verify response status
-            status = root.find(".//samlp:StatusCode", self.SAML_NS)
+            status = self._find(root, self._xp_status, self.TAG_STATUS_CODE)
             if status is not None:
                 status_value = status.get("Value", "")
                 if "Success" not in status_value:
@@ -235,7 +400,7 @@ class SAMLAuthenticator(SSOAuthenticator):
                     return None
 
             # Extract assertion
-            assertion = root.find(".//saml:Assertion", self.SAML_NS)
+            assertion = self._find(root, self._xp_assertion, self.TAG_ASSERTION)
             if assertion is None:
                 logger.error("No assertion in SAML response")
                 return None
@@ -253,6 +418,30 @@ class SAMLAuthenticator(SSOAuthenticator):
             logger.error(f"SAML processing error: {e}")
             return None
 
+    def _parse_response(self, response_xml: bytes) -> Any:
+        """Parse a SAML response, preferring lxml when it is installed."""
+        if LXML_AVAILABLE:
+            root = LET.fromstring(response_xml, parser=self._XML_PARSER)
+            if root.getroottree().docinfo.doctype:
+                raise ValueError("DTDs are not allowed in SAML messages")
+            return root
+
+        parser = ET.XMLParser(target=_NoDoctypeTreeBuilder())
+        parser.feed(response_xml)
+        return parser.close()
+
+    def _find(self, element: Any, xpath: Any, tag: str) -> Optional[Any]:
+        """
+        Find the first descendant matching a query.
+
+        Uses the precompiled XPath under lxml and a walk for the
+        Clark-notation tag under ElementTree.
+        """
+        if LXML_AVAILABLE:
+            nodes = xpath(element)
+            return nodes[0] if nodes else None
+        return next(element.iter(tag), None)
+
     def _verify_signature(self, root: ET.Element) -> bool:
         """Verify XML signature."""
         # Full implementation would use xmlsec1 or signxml library
@@ -260,32 +449,40 @@ class SAMLAuthenticator(SSOAuthenticator):
         logger.warning("SAML signature verification not fully implemented")
 
         # Check if signature exists
-        signature = root.find(".//ds:Signature", self.SAML_NS)
+        signature = self._find(root, self._xp_signature, self.TAG_SIGNATURE)
         return signature is not None
 
     def _extract_user(self, assertion: ET.Element) -> Optional[SSOUser]:
         """Extract user information from SAML assertion."""
         try:
-            # Get NameID
-            name_id = assertion.find(".//saml:NameID", self.SAML_NS)
-            user_id = name_id.text if name_id is not None else None
+            # Collect the NameID and attribute values in one document-order
+            # walk; each AttributeValue belongs to the Attribute before it
+            user_id = None
+            found_name_id = False
+            collected: Dict[str, List[str]] = {}
+            values: Optional[List[str]] = None
+            tag_value = self.TAG_ATTRIBUTE_VALUE
+            tag_attribute = self.TAG_ATTRIBUTE
+            tag_name_id = self.TAG_NAMEID
+
+            for elem in assertion.iter():
+                tag = elem.tag
+                if tag == tag_value:
+                    if values is not None and elem.text:
+                        values.append(elem.text)
+                elif tag == tag_attribute:
+                    values = collected[elem.get("Name", "")] = []
+                elif tag == tag_name_id and not found_name_id:
+                    user_id = elem.text
+                    found_name_id = True
 
             if not user_id:
                 return None
 
-            # Get attributes
-            attributes = {}
-            attr_statement = assertion.find(".//saml:AttributeStatement", self.SAML_NS)
-
-            if attr_statement is not None:
-                for attr in attr_statement.findall("saml:Attribute", self.SAML_NS):
-                    name = attr.get("Name", "")
-                    values = [
-                        v.text for v in attr.findall("saml:AttributeValue", self.SAML_NS)
-                        if v.text
-                    ]
-                    if values:
-                        attributes[name] = values[0] if len(values) == 1 else values
+            attributes = {
+                name: vals[0] if len(vals) == 1 else vals
+                for name, vals in collected.items() if vals
+            }
 
             # Map attributes
             mapping = self._config.attribute_mapping
@@ -322,7 +519,11 @@ class SAMLAuthenticator(SSOAuthenticator):
         return self._config.slo_url
 
     def get_metadata(self) -> str:
-        """Generate SAML SP metadata XML."""
+        """Get SAML SP metadata XML."""
+        return self._metadata_xml
+
+    def _render_metadata(self) -> str:
+        """Render SAML SP metadata XML."""
         return f"""<?xml version="1.0" encoding="UTF-8"?>
 <EntityDescriptor xmlns="urn:oasis:names:tc:SAML:2.0:metadata"
     entityID="{self._config.entity_id}">
@@ -371,7 +572,8 @@ class OIDCConfig:
     @classmethod
     async def from_discovery(cls, issuer: str, client_id: str, client_secret: str, redirect_uri: str) -> "OIDCConfig":
         """Create config from OIDC discovery."""
-        import aiohttp
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("aiohttp is required for OIDC discovery")
 
         discovery_url = f"{issuer.rstrip('/')}/.well-known/openid-configuration"
 
@@ -408,8 +610,17 @@ class OIDCAuthenticator(SSOAuthenticator):
             config: OIDC configuration
         """
         self._config = config
-        self._pending_states: Dict[str, datetime] = {}
-        self._nonces: Dict[str, str] = {}
+        # Maps state to its nonce
+        self._pending_states = _PendingLogins()
+        self._session = None
+
+        # Only state and nonce vary between authorization requests
+        self._static_query = urllib.parse.urlencode({
+            "client_id": config.client_id,
+            "redirect_uri": config.redirect_uri,
+            "response_type": config.response_type,
+            "scope": " ".join(config.scopes),
+        })
 
     def get_login_url(self, state: Optional[str] = None) -> str:
         """
@@ -426,19 +637,13 @@ class OIDCAuthenticator(SSOAuthenticator):
 
         nonce = secrets.token_urlsafe(32)
 
-        self._pending_states[state] = datetime.utcnow()
-        self._nonces[state] = nonce
+        self._pending_states.add(state, nonce)
 
-        params = {
-            "client_id": self._config.client_id,
-            "redirect_uri": self._config.redirect_uri,
-            "response_type": self._config.response_type,
-            "scope": " ".join(self._config.scopes),
-            "state": state,
-            "nonce": nonce,
-        }
-
-        return f"{self._config.authorization_endpoint}?{urllib.parse.urlencode(params)}"
+        quote = urllib.parse.quote_plus
+        return (
+            f"{self._config.authorization_endpoint}?{self._static_query}"
+            f"&state={quote(state)}&nonce={quote(nonce)}"
+        )
 
     async def process_callback(self, data: Dict[str, Any]) -> Optional[SSOUser]:
         """
@@ -457,13 +662,14 @@ class OIDCAuthenticator(SSOAuthenticator):
 
         # Verify state
         state = data.get("state")
-        if not state or state not in self._pending_states:
+        pending = self._pending_states.pop(state) if state else None
+        if pending is None:
             logger.error("Invalid or missing state parameter")
             return None
 
         # Check state age
-        state_time = self._pending_states.pop(state)
-        if datetime.utcnow() - state_time > timedelta(minutes=10):
+        state_time, expected_nonce = pending
+        if self._pending_states.is_expired(state_time):
             logger.error("State parameter expired")
             return None
 
@@ -486,7 +692,6 @@ class OIDCAuthenticator(SSOAuthenticator):
             claims = self._parse_jwt(id_token) if id_token else {}
 
             # Verify nonce
-            expected_nonce = self._nonces.pop(state, None)
             if expected_nonce and claims.get("nonce") != expected_nonce:
                 logger.error("Invalid nonce in ID token")
                 return None
@@ -512,10 +717,29 @@ class OIDCAuthenticator(SSOAuthenticator):
             logger.error(f"OIDC processing error: {e}")
             return None
 
+    async def _get_session(self) -> Any:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            if not AIOHTTP_AVAILABLE:
+                raise RuntimeError("aiohttp is required for OIDC authentication")
+
+            # One pooled session keeps connections and TLS sessions to the
+            # token and userinfo endpoints alive between callbacks
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, ttl_dns_cache=300, keepalive_timeout=60
+                ),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def _exchange_code(self, code: str) -> Optional[Dict[str, Any]]:
         """Exchange authorization code for tokens."""
-        import aiohttp
-
         data = {
             "grant_type": "authorization_code",
             "code": code,
@@ -524,43 +748,45 @@ class OIDCAuthenticator(SSOAuthenticator):
             "client_secret": self._config.client_secret,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self._config.token_endpoint,
-                data=data,
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Token exchange failed: {error_text}")
-                    return None
-                return await response.json()
+        session = await self._get_session()
+        async with session.post(
+            self._config.token_endpoint,
+            data=data,
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"Token exchange failed: {error_text}")
+                return None
+            return await response.json()
 
     async def _get_userinfo(self, access_token: str) -> Dict[str, Any]:
         """Get user info from userinfo endpoint."""
-        import aiohttp
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                self._config.userinfo_endpoint,
-                headers={"Authorization": f"Bearer {access_token}"},
-            ) as response:
-                if response.status != 200:
-                    return {}
-                return await response.json()
+        session = await self._get_session()
+        async with session.get(
+            self._config.userinfo_endpoint,
+            headers={"Authorization": f"Bearer {access_token}"},
+        ) as response:
+            if response.status != 200:
+                return {}
+            return await response.json()
 
     def _parse_jwt(self, token: str) -> Dict[str, Any]:
         """Parse JWT claims without verification (verification should be added)."""
         try:
-            parts = token.split('.')
-            if len(parts) != 3:
+            # Locate the payload between the two dots without splitting
+            first = token.find('.')
+            second = token.find('.', first + 1)
+            if first < 0 or second < 0 or token.find('.', second + 1) >= 0:
                 return {}
 
             # Decode payload
-            payload = parts[1]
-            # Add padding
-            payload += '=' * (4 - len(payload) % 4)
+            payload = token[first + 1:second]
+            # Restore the stripped base64 padding, if any is needed
+            pad = -len(payload) & 3
+            if pad:
+                payload += '=' * pad
             decoded = base64.urlsafe_b64decode(payload)
-            return json.loads(decoded)
+            return _json_loads(decoded)
 
         except Exception as e:
             logger.error(f"JWT parse error: {e}")
@@ -623,19 +849,77 @@ class LDAPAuthenticator(SSOAuthenticator):
         self._config = config
         self._ldap_available = self._check_ldap()
 
+        # The service-account connection is opened on first use and shared
+        # by user searches and group lookups; only the bind that checks a
+        # user's password needs a connection of its own
+        self._server = None
+        self._search_conn = None
+        self._conn_lock = threading.Lock()
+
     def _check_ldap(self) -> bool:
         """Check if ldap3 library is available."""
-        try:
-            import ldap3
-            return True
-        except ImportError:
+        if not LDAP3_AVAILABLE:
             logger.warning("ldap3 library not available")
-            return False
+        return LDAP3_AVAILABLE
 
     def get_login_url(self, state: Optional[str] = None) -> str:
         """LDAP doesn't use redirect-based login."""
         return ""
 
+    def _get_server(self) -> Any:
+        """Get the LDAP server definition, creating it on first use."""
+        if self._server is None:
+            self._server = ldap3.Server(
+                self._config.server,
+                port=self._config.port,
+                use_ssl=self._config.use_ssl,
+                get_info=ldap3.ALL,
+            )
+        return self._server
+
+    def _open_connection(
+        self,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Optional[Any]:
+        """
+        Open and bind a connection to the LDAP server.
+
+        STARTTLS is negotiated before binding so credentials are never
+        sent in the clear.
+
+        Returns:
+            Bound connection, or None if the bind was rejected
+        """
+        conn = ldap3.Connection(self._get_server(), user=user, password=password, **kwargs)
+        conn.open()
+
+        if self._config.use_tls and not self._config.use_ssl:
+            conn.start_tls()
+
+        if not conn.bind():
+            conn.unbind()
+            return None
+        return conn
+
+    def _get_search_connection(self) -> Any:
+        """
+        Get the shared service-account connection.
+
+        The connection is reopened if it has been unbound. Callers must
+        hold ``self._conn_lock``.
+        """
+        if self._search_conn is None or not self._search_conn.bound:
+            self._search_conn = self._open_connection(
+                self._config.bind_dn,
+                self._config.bind_password,
+                client_strategy=ldap3.RESTARTABLE,
+            )
+            if self._search_conn is None:
+                raise RuntimeError("LDAP service account bind failed")
+        return self._search_conn
+
     async def authenticate(
         self,
         username: str,
@@ -654,60 +938,37 @@ class LDAPAuthenticator(SSOAuthenticator):
         if not self._ldap_available:
             return None
 
-        try:
-            import ldap3
-            from ldap3 import Server, Connection, ALL, SUBTREE
-
-            # Connect to LDAP server
-            server = Server(
-                self._config.server,
-                port=self._config.port,
-                use_ssl=self._config.use_ssl,
-                get_info=ALL,
-            )
-
-            # Bind with service account to search for user
-            if self._config.bind_dn:
-                search_conn = Connection(
-                    server,
-                    user=self._config.bind_dn,
-                    password=self._config.bind_password,
-                    auto_bind=True,
-                )
-            else:
-                search_conn = Connection(server, auto_bind=True)
-
-            if self._config.use_tls and not self._config.use_ssl:
-                search_conn.start_tls()
+        # ldap3 performs blocking socket I/O, so keep it off the event loop
+        return await asyncio.to_thread(self._authenticate_sync, username, password)
 
+    def _authenticate_sync(self, username: str, password: str) -> Optional[SSOUser]:
+        """Authenticate user against LDAP, blocking on network I/O."""
+        try:
             # Search for user
             search_filter = self._config.user_search_filter.format(username=username)
-            search_conn.search(
-                self._config.base_dn,
-                search_filter,
-                search_scope=SUBTREE,
-                attributes=['*'],
-            )
+            with self._conn_lock:
+                search_conn = self._get_search_connection()
+                search_conn.search(
+                    self._config.base_dn,
+                    search_filter,
+                    search_scope=ldap3.SUBTREE,
+                    attributes=['*'],
+                )
+                entries = search_conn.entries
 
-            if not search_conn.entries:
+            if not entries:
                 logger.warning(f"User not found: {username}")
                 return None
 
-            user_entry = search_conn.entries[0]
+            user_entry = entries[0]
             user_dn = user_entry.entry_dn
-            search_conn.unbind()
 
             # Authenticate user
-            user_conn = Connection(
-                server,
-                user=user_dn,
-                password=password,
-                auto_bind=True,
-            )
-
-            if not user_conn.bound:
+            user_conn = self._open_connection(user_dn, password)
+            if user_conn is None:
                 logger.warning(f"Authentication failed for: {username}")
                 return None
+            user_conn.unbind()
 
             # Get user attributes
             user_id = str(getattr(user_entry, self._config.user_id_attribute, username))
@@ -715,9 +976,7 @@ class LDAPAuthenticator(SSOAuthenticator):
             display_name = str(getattr(user_entry, self._config.display_name_attribute, ""))
 
             # Get group memberships
-            groups = await self._get_user_groups(server, user_dn)
-
-            user_conn.unbind()
+            groups = self._get_user_groups_sync(user_dn)
 
             return SSOUser(
                 user_id=user_id,
@@ -731,36 +990,39 @@ class LDAPAuthenticator(SSOAuthenticator):
             logger.error(f"LDAP authentication error: {e}")
             return None
 
-    async def _get_user_groups(self, server, user_dn: str) -> List[str]:
+    async def _get_user_groups(self, user_dn: str) -> List[str]:
         """Get user's group memberships."""
-        try:
-            import ldap3
-            from ldap3 import Connection, SUBTREE
-
-            conn = Connection(
-                server,
-                user=self._config.bind_dn,
-                password=self._config.bind_password,
-                auto_bind=True,
-            )
+        return await asyncio.to_thread(self._get_user_groups_sync, user_dn)
 
+    def _get_user_groups_sync(self, user_dn: str) -> List[str]:
+        """Get user's group memberships, blocking on network I/O."""
+        try:
             search_filter = self._config.group_search_filter.format(user_dn=user_dn)
-            conn.search(
-                self._config.base_dn,
-                search_filter,
-                search_scope=SUBTREE,
-                attributes=['cn'],
-            )
-
-            groups = [str(entry.cn) for entry in conn.entries]
-            conn.unbind()
-
-            return groups
+            with self._conn_lock:
+                conn = self._get_search_connection()
+                conn.search(
+                    self._config.base_dn,
+                    search_filter,
+                    search_scope=ldap3.SUBTREE,
+                    attributes=['cn'],
+                )
+                return [str(entry.cn) for entry in conn.entries]
 
         except Exception as e:
             logger.error(f"Group lookup error: {e}")
             return []
 
+    async def aclose(self) -> None:
+        """Unbind the shared service-account connection."""
+        await asyncio.to_thread(self._close_sync)
+
+    def _close_sync(self) -> None:
+        """Unbind the shared service-account connection, blocking on I/O."""
+        with self._conn_lock:
+            if self._search_conn is not None:
+                self._search_conn.unbind()
+                self._search_conn = None
+
     async def process_callback(self, data: Dict[str, Any]) -> Optional[SSOUser]:
         """LDAP doesn't use callbacks - use authenticate() instead."""
         return None
@@ -777,11 +1039,40 @@ class SSOService:
     Provides a unified interface for SSO authentication.
     """
 
+    __slots__ = (
+        "_authenticators",
+        "_default_authenticator",
+        "_default_auth_obj",
+        "_group_role_mapping",
+    )
+
     def __init__(self):
         """Initialize SSO service."""
         self._authenticators: Dict[str, SSOAuthenticator] = {}
         self._default_authenticator: Optional[str] = None
-        self._group_role_mapping: Dict[str, List[str]] = {}
+        # The default authenticator itself, so the common path skips the
+        # name lookup
+        self._default_auth_obj: Optional[SSOAuthenticator] = None
+        self._group_role_mapping: Dict[str, Tuple[str, ...]] = {}
+
+    def _add_authenticator(
+        self,
+        name: str,
+        auth: SSOAuthenticator,
+        default: bool,
+    ) -> None:
+        """Register an authenticator, keeping the default reference current."""
+        self._authenticators[name] = auth
+        if default:
+            self._default_authenticator = name
+        if name == self._default_authenticator:
+            self._default_auth_obj = auth
+
+    def _resolve(self, authenticator: Optional[str]) -> Optional[SSOAuthenticator]:
+        """Look up an authenticator by name, or the default if none is given."""
+        if not authenticator:
+            return self._default_auth_obj
+        return self._authenticators.get(authenticator)
 
     def register_saml(
         self,
@@ -790,9 +1081,7 @@ class SSOService:
         default: bool = False,
     ) -> None:
         """Register a SAML authenticator."""
-        self._authenticators[name] = SAMLAuthenticator(config)
-        if default:
-            self._default_authenticator = name
+        self._add_authenticator(name, SAMLAuthenticator(config), default)
         logger.info(f"Registered SAML authenticator: {name}")
 
     def register_oidc(
@@ -802,9 +1091,7 @@ class SSOService:
         default: bool = False,
     ) -> None:
         """Register an OIDC authenticator."""
-        self._authenticators[name] = OIDCAuthenticator(config)
-        if default:
-            self._default_authenticator = name
+        self._add_authenticator(name, OIDCAuthenticator(config), default)
         logger.info(f"Registered OIDC authenticator: {name}")
 
     def register_ldap(
@@ -814,9 +1101,7 @@ class SSOService:
         default: bool = False,
     ) -> None:
         """Register an LDAP authenticator."""
-        self._authenticators[name] = LDAPAuthenticator(config)
-        if default:
-            self._default_authenticator = name
+        self._add_authenticator(name, LDAPAuthenticator(config), default)
         logger.info(f"Registered LDAP authenticator: {name}")
 
     def set_group_role_mapping(self, mapping: Dict[str, List[str]]) -> None:
@@ -826,7 +1111,9 @@ class SSOService:
         Args:
             mapping: Dict of group name to list of roles
         """
-        self._group_role_mapping = mapping
+        self._group_role_mapping = {
+            group: tuple(roles) for group, roles in mapping.items()
+        }
 
     def get_login_url(
         self,
@@ -834,12 +1121,11 @@ class SSOService:
         state: Optional[str] = None,
     ) -> Optional[str]:
         """Get login URL for an authenticator."""
-        name = authenticator or self._default_authenticator
-
-        if name not in self._authenticators:
+        auth = self._resolve(authenticator)
+        if auth is None:
             return None
 
-        return self._authenticators[name].get_login_url(state)
+        return auth.get_login_url(state)
 
     async def process_callback(
         self,
@@ -856,10 +1142,11 @@ class SSOService:
         Returns:
             Authenticated user or None
         """
-        if authenticator not in self._authenticators:
+        auth = self._authenticators.get(authenticator)
+        if auth is None:
             return None
 
-        user = await self._authenticators[authenticator].process_callback(data)
+        user = await auth.process_callback(data)
 
         if user:
             # Apply group-role mapping
@@ -884,12 +1171,7 @@ class SSOService:
         Returns:
             Authenticated user or None
         """
-        name = authenticator or self._default_authenticator
-
-        if name not in self._authenticators:
-            return None
-
-        auth = self._authenticators[name]
+        auth = self._resolve(authenticator)
         if not isinstance(auth, LDAPAuthenticator):
             return None
 
@@ -902,13 +1184,25 @@ class SSOService:
 
     def _map_groups_to_roles(self, groups: List[str]) -> List[str]:
         """Map group memberships to roles."""
-        roles = set()
-
-        for group in groups:
-            if group in self._group_role_mapping:
-                roles.update(self._group_role_mapping[group])
+        mapping = self._group_role_mapping
+        return list({
+            role for group in groups if group in mapping for role in mapping[group]
+        })
+
+    async def aclose(self) -> None:
+        """Close connections held by all registered authenticators."""
+        for auth in self._authenticators.values():
+            await auth.aclose()
+
+    @staticmethod
+    def dump_users_json(users: List[SSOUser]) -> bytes:
+        """
+        Serialize users to a JSON array for bulk responses.
 
-        return list(roles)
+        Each user is encoded as ``SSOUser.to_dict`` does, so SSO session
+        IDs are never included.
+        """
+        return _json_dumps([user.to_dict() for user in users])
 
     def list_authenticators(self) -> List[str]:
         """List registered authenticators."""
@@ -920,9 +1214,8 @@ class SSOService:
         session_id: Optional[str] = None,
     ) -> Optional[str]:
         """Get logout URL for an authenticator."""
-        name = authenticator or self._default_authenticator
-
-        if name not in self._authenticators:
+        auth = self._resolve(authenticator)
+        if auth is None:
             return None
 
-        return self._authenticators[name].get_logout_url(session_id)
+        return auth.get_logout_url(session_id)
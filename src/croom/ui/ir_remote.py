@@ -13,13 +13,25 @@ Features:
 """
 
 import asyncio
+import json
 import logging
 import os
-import socket
+from collections import ChainMap
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from time import monotonic_ns
+from types import MappingProxyType
+from typing import (
+    Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -69,12 +81,45 @@ class IRAction(Enum):
     BLUE = "blue"
 
 
-@dataclass
+# Lookups resolved once at import instead of parsing enum values per event
+_ACTION_BY_VALUE: Dict[str, IRAction] = {a.value: a for a in IRAction}
+
+# Actions that fire once per press; held-key repeats for these are dropped
+# before dispatch. Navigation and volume actions stay repeatable.
+_NO_REPEAT: FrozenSet[IRAction] = frozenset({
+    IRAction.OK, IRAction.BACK, IRAction.HOME, IRAction.MUTE,
+    IRAction.TOGGLE_MIC, IRAction.TOGGLE_CAMERA, IRAction.LEAVE_MEETING,
+    IRAction.RAISE_HAND, IRAction.SHARE_SCREEN,
+    IRAction.RED, IRAction.GREEN, IRAction.YELLOW, IRAction.BLUE,
+    *(getattr(IRAction, f"NUM_{i}") for i in range(10)),
+})
+
+# Shared read-only QML payloads, so key presses allocate no dicts
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+_UP = MappingProxyType({"direction": "up"})
+_DOWN = MappingProxyType({"direction": "down"})
+_NAV_PAYLOAD: Dict[IRAction, Mapping[str, Any]] = {
+    IRAction.UP: _UP,
+    IRAction.DOWN: _DOWN,
+    IRAction.LEFT: MappingProxyType({"direction": "left"}),
+    IRAction.RIGHT: MappingProxyType({"direction": "right"}),
+}
+_NUM_PAYLOAD: Dict[IRAction, Mapping[str, Any]] = {
+    getattr(IRAction, f"NUM_{i}"): MappingProxyType({"digit": i})
+    for i in range(10)
+}
+
+
+def _NOOP(*args: Any) -> None:
+    """Stand-in for a QML sender while navigation is off or unbridged."""
+
+
+@dataclass(slots=True)
 class IRKeymap:
     """IR remote keymap configuration."""
     name: str
     remote_type: str
-    mappings: Dict[str, IRAction] = field(default_factory=dict)
+    mappings: Mapping[str, IRAction] = field(default_factory=dict)
     repeat_delay: int = 200  # ms before repeat starts
     repeat_rate: int = 100   # ms between repeats
 
@@ -236,6 +281,18 @@ BUILTIN_KEYMAPS = {
     "croom": CROOM_KEYMAP,
 }
 
+# Built-in keymaps are shared by every service; keep their tables read-only
+for _keymap in BUILTIN_KEYMAPS.values():
+    _keymap.mappings = MappingProxyType(_keymap.mappings)
+del _keymap
+
+# Every LIRC key name any built-in keymap knows about
+_EVER_MAPPED: FrozenSet[bytes] = frozenset(
+    key_name.encode('ascii')
+    for keymap in BUILTIN_KEYMAPS.values()
+    for key_name in keymap.mappings
+)
+
 
 class LIRCClient:
     """
@@ -244,14 +301,25 @@ class LIRCClient:
     Connects to lircd socket and receives IR key events.
     """
 
+    __slots__ = (
+        "_socket_path",
+        "_timeout",
+        "_reader",
+        "_writer",
+        "_loop",
+        "_connected",
+    )
+
     def __init__(
         self,
         socket_path: str = "/var/run/lirc/lircd",
-        timeout: float = 0.1
+        timeout: Optional[float] = None
     ):
         self._socket_path = socket_path
         self._timeout = timeout
-        self._socket: Optional[socket.socket] = None
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._connected = False
 
     async def connect(self) -> bool:
@@ -261,16 +329,11 @@ class LIRCClient:
                 logger.error(f"LIRC socket not found: {self._socket_path}")
                 return False
 
-            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self._socket.setblocking(False)
-            self._socket.settimeout(self._timeout)
-
-            # Run blocking connect in thread
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                self._socket.connect,
-                self._socket_path
+            # Stream I/O runs on the event loop itself, so reads need no
+            # executor thread hop
+            self._loop = asyncio.get_running_loop()
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                path=self._socket_path
             )
 
             self._connected = True
@@ -283,9 +346,14 @@ class LIRCClient:
 
     async def disconnect(self) -> None:
         """Disconnect from LIRC daemon."""
-        if self._socket:
-            self._socket.close()
-            self._socket = None
+        if self._writer:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except Exception:
+                pass
+        self._reader = None
+        self._writer = None
         self._connected = False
         logger.info("Disconnected from LIRC daemon")
 
@@ -300,34 +368,46 @@ class LIRCClient:
         Returns:
             Tuple of (key_name, remote_name, repeat_count) or None
         """
-        if not self._socket or not self._connected:
+        result = await self.read_raw_key()
+        if result is None:
+            return None
+
+        key_name, remote_name, repeat = result
+        return (key_name.decode('ascii'), remote_name.decode('ascii'), repeat)
+
+    async def read_raw_key(self) -> Optional[Tuple[bytes, bytes, int]]:
+        """
+        Read a key press from LIRC without decoding the names.
+
+        Returns:
+            Tuple of (key_name, remote_name, repeat_count) with the names
+            as raw bytes, or None
+
+        Raises:
+            ConnectionResetError: If lircd closed the connection
+            OSError: If the socket failed for another reason
+        """
+        if not self._reader or not self._connected:
             return None
 
         try:
-            loop = asyncio.get_event_loop()
             data = await asyncio.wait_for(
-                loop.run_in_executor(None, self._socket.recv, 256),
+                self._reader.readline(),
                 timeout=self._timeout
             )
 
             if not data:
-                return None
+                raise ConnectionResetError("LIRC daemon closed the connection")
 
             # LIRC format: <code> <repeat> <key_name> <remote_name>
-            line = data.decode().strip()
-            parts = line.split()
+            parts = data.rstrip().split(b' ', 3)
 
-            if len(parts) >= 4:
-                code = parts[0]
-                repeat = int(parts[1], 16)
-                key_name = parts[2]
-                remote_name = parts[3]
-
-                return (key_name, remote_name, repeat)
+            if len(parts) == 4:
+                return (parts[2], parts[3], int(parts[1], 16))
 
         except asyncio.TimeoutError:
             return None
-        except Exception as e:
+        except ValueError as e:
             logger.debug(f"Error reading LIRC: {e}")
             return None
 
@@ -341,20 +421,55 @@ class IRRemoteService:
     Manages IR input, key mapping, and action dispatch.
     """
 
+    __slots__ = (
+        "_lirc",
+        "_custom_keymaps",
+        "_all_keymaps",
+        "_known_keys",
+        "_running",
+        "_loop",
+        "_task",
+        "_listeners",
+        "_global_listeners",
+        "_last_key",
+        "_last_key_time",
+        "_repeat_count",
+        "_dispatch",
+        "_keymap",
+        "_repeat_delay_ns",
+        "_repeat_rate_ns",
+    )
+
     def __init__(
         self,
         lirc_socket: str = "/var/run/lirc/lircd",
         keymap: Optional[IRKeymap] = None
     ):
         self._lirc = LIRCClient(lirc_socket)
-        self._keymap = keymap or SAMSUNG_KEYMAP
         self._custom_keymaps: Dict[str, IRKeymap] = {}
+        # Custom keymaps shadow built-ins of the same name
+        self._all_keymaps = ChainMap(self._custom_keymaps, BUILTIN_KEYMAPS)
+        # Key names mapped by any known keymap; anything else is line noise
+        self._known_keys: FrozenSet[bytes] = _EVER_MAPPED
         self._running = False
-        self._listeners: Dict[IRAction, List[Callable]] = {}
-        self._last_key: Optional[str] = None
-        self._last_key_time: float = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        # Listeners are stored as (is_coroutine, callback) so the check is
+        # made once at registration rather than on every event
+        self._listeners: Dict[IRAction, List[Tuple[bool, Callable]]] = {}
+        # Listeners for every action, stored once and called after the
+        # action-specific ones
+        self._global_listeners: List[Tuple[bool, Callable]] = []
+        self._last_key: Optional[bytes] = None
+        self._last_key_time: int = 0  # monotonic ns
         self._repeat_count: int = 0
 
+        # Raw LIRC key name -> (action, [(is_coroutine, callback), ...]),
+        # rebuilt whenever the keymap or listeners change. Keys are bytes so
+        # names read from the socket are looked up without decoding.
+        self._dispatch: Dict[bytes, Tuple[IRAction, List[Tuple[bool, Callable]]]] = {}
+        self._apply_keymap(keymap or SAMSUNG_KEYMAP)
+
     async def start(self) -> bool:
         """Start the IR remote service."""
         if self._running:
@@ -365,7 +480,9 @@ class IRRemoteService:
             return False
 
         self._running = True
-        asyncio.create_task(self._read_loop())
+        # Keep a strong reference; the loop only holds tasks weakly
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(self._read_loop(), name="ir-read-loop")
 
         logger.info(f"IR remote service started with keymap: {self._keymap.name}")
         return True
@@ -373,38 +490,73 @@ class IRRemoteService:
     async def stop(self) -> None:
         """Stop the IR remote service."""
         self._running = False
+        task, self._task = self._task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.error(f"IR read loop failed: {e}")
         await self._lirc.disconnect()
         logger.info("IR remote service stopped")
 
     def set_keymap(self, keymap: IRKeymap) -> None:
         """Set the active keymap."""
-        self._keymap = keymap
+        self._apply_keymap(keymap)
         logger.info(f"Keymap changed to: {keymap.name}")
 
     def set_keymap_by_name(self, name: str) -> bool:
-        """Set keymap by name from built-in or custom keymaps."""
-        if name in BUILTIN_KEYMAPS:
-            self._keymap = BUILTIN_KEYMAPS[name]
-            return True
-        elif name in self._custom_keymaps:
-            self._keymap = self._custom_keymaps[name]
-            return True
-        return False
+        """Set keymap by name from custom or built-in keymaps."""
+        keymap = self._all_keymaps.get(name)
+        if keymap is None:
+            return False
+        self._apply_keymap(keymap)
+        return True
+
+    def _apply_keymap(self, keymap: IRKeymap) -> None:
+        """Activate a keymap and precompute its repeat thresholds."""
+        self._keymap = keymap
+        self._repeat_delay_ns = keymap.repeat_delay * 1_000_000
+        self._repeat_rate_ns = keymap.repeat_rate * 1_000_000
+        self._rebuild_dispatch()
+
+    def _rebuild_dispatch(self) -> None:
+        """Rebuild the key name to action and listener table."""
+        per_action: Dict[IRAction, List[Tuple[bool, Callable]]] = {}
+        dispatch = {}
+
+        for key_name, action in self._keymap.mappings.items():
+            listeners = per_action.get(action)
+            if listeners is None:
+                listeners = per_action[action] = (
+                    self._listeners.get(action, []) + self._global_listeners
+                )
+            dispatch[key_name.encode('ascii')] = (action, listeners)
+
+        self._dispatch = dispatch
 
     def add_custom_keymap(self, keymap: IRKeymap) -> None:
         """Add a custom keymap."""
         self._custom_keymaps[keymap.remote_type] = keymap
+        self._update_known_keys(keymap)
+
+    def _update_known_keys(self, keymap: IRKeymap) -> None:
+        """Extend the known key names with a newly added keymap."""
+        self._known_keys = self._known_keys.union(
+            key_name.encode('ascii') for key_name in keymap.mappings
+        )
 
     def load_keymap_from_file(self, path: str) -> Optional[IRKeymap]:
         """Load keymap from JSON configuration file."""
-        import json
-
         try:
-            with open(path) as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
             mappings = {
-                k: IRAction(v) for k, v in data.get("mappings", {}).items()
+                k: _ACTION_BY_VALUE[v] for k, v in data.get("mappings", {}).items()
             }
 
             keymap = IRKeymap(
@@ -416,6 +568,7 @@ class IRRemoteService:
             )
 
             self._custom_keymaps[keymap.remote_type] = keymap
+            self._update_known_keys(keymap)
             logger.info(f"Loaded custom keymap: {keymap.name}")
             return keymap
 
@@ -435,9 +588,10 @@ class IRRemoteService:
             action: The IR action to listen for
             callback: Function called with (action, repeat_count)
         """
-        if action not in self._listeners:
-            self._listeners[action] = []
-        self._listeners[action].append(callback)
+        self._listeners.setdefault(action, []).append(
+            (asyncio.iscoroutinefunction(callback), callback)
+        )
+        self._rebuild_dispatch()
 
     def remove_listener(
         self,
@@ -445,47 +599,77 @@ class IRRemoteService:
         callback: Callable[[IRAction, int], None]
     ) -> None:
         """Remove a listener."""
-        if action in self._listeners:
-            try:
-                self._listeners[action].remove(callback)
-            except ValueError:
-                pass
+        listeners = self._listeners.get(action)
+        if listeners:
+            self._remove_entry(listeners, callback)
 
     def add_global_listener(
         self,
         callback: Callable[[IRAction, int], None]
     ) -> None:
         """Add listener for all IR actions."""
-        for action in IRAction:
-            self.add_listener(action, callback)
+        self._global_listeners.append(
+            (asyncio.iscoroutinefunction(callback), callback)
+        )
+        self._rebuild_dispatch()
+
+    def remove_global_listener(
+        self,
+        callback: Callable[[IRAction, int], None]
+    ) -> None:
+        """Remove a listener added with add_global_listener."""
+        self._remove_entry(self._global_listeners, callback)
+
+    def _remove_entry(
+        self,
+        listeners: List[Tuple[bool, Callable]],
+        callback: Callable[[IRAction, int], None]
+    ) -> None:
+        """Remove the first registration of callback from a listener list."""
+        for i, (_, registered) in enumerate(listeners):
+            # Equality rather than identity: bound methods are new objects
+            # on every attribute access
+            if registered == callback:
+                del listeners[i]
+                self._rebuild_dispatch()
+                return
 
     async def _read_loop(self) -> None:
         """Main loop for reading IR input."""
         while self._running:
             try:
-                result = await self._lirc.read_key()
+                # Suspends until lircd sends a line; no polling interval
+                result = await self._lirc.read_raw_key()
 
                 if result:
                     key_name, remote_name, repeat = result
                     await self._handle_key(key_name, repeat)
 
-            except Exception as e:
-                logger.error(f"Error in IR read loop: {e}")
-                await asyncio.sleep(0.5)
-
-            await asyncio.sleep(0.01)
+            except (OSError, asyncio.IncompleteReadError) as e:
+                if self._running:
+                    # Leave the service stopped so start() reconnects
+                    logger.warning(f"Lost LIRC connection, IR service needs restart: {e}")
+                    self._running = False
+                    await self._lirc.disconnect()
+                break
 
-    async def _handle_key(self, key_name: str, repeat: int) -> None:
+    async def _handle_key(self, key_name: bytes, repeat: int) -> None:
         """Handle a key press from LIRC."""
-        action = self._keymap.mappings.get(key_name)
+        entry = self._dispatch.get(key_name)
 
-        if not action:
-            logger.debug(f"Unmapped IR key: {key_name}")
+        if entry is None:
+            # Only report keys another keymap would handle, not IR noise
+            if key_name in self._known_keys:
+                logger.debug(f"Unmapped IR key: {key_name.decode('ascii', 'replace')}")
+            return
+
+        action, listeners = entry
+
+        if repeat and action in _NO_REPEAT:
             return
 
         # Handle key repeat
-        import time
-        current_time = time.time() * 1000
+        current_time = monotonic_ns()
 
         if repeat == 0:
             # New key press
@@ -497,34 +681,34 @@ class IRRemoteService:
             if key_name != self._last_key:
                 return
 
-            elapsed = current_time - self._last_key_time
-
-            if self._repeat_count == 0:
-                # First repeat - check delay
-                if elapsed < self._keymap.repeat_delay:
-                    return
-            else:
-                # Subsequent repeats - check rate
-                if elapsed < self._keymap.repeat_rate:
-                    return
+            # First repeat waits for the delay, later ones for the rate
+            repeat_count = self._repeat_count
+            if current_time - self._last_key_time < (
+                self._repeat_rate_ns if repeat_count else self._repeat_delay_ns
+            ):
+                return
 
-            self._repeat_count += 1
+            self._repeat_count = repeat_count + 1
             self._last_key_time = current_time
 
         # Dispatch to listeners
-        await self._dispatch_action(action, self._repeat_count)
+        await self._dispatch_action(action, self._repeat_count, listeners)
 
-    async def _dispatch_action(self, action: IRAction, repeat: int) -> None:
+    async def _dispatch_action(
+        self,
+        action: IRAction,
+        repeat: int,
+        listeners: List[Tuple[bool, Callable]],
+    ) -> None:
         """Dispatch action to listeners."""
-        if action in self._listeners:
-            for callback in self._listeners[action]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(action, repeat)
-                    else:
-                        callback(action, repeat)
-                except Exception as e:
-                    logger.error(f"Error in IR listener callback: {e}")
+        for is_coroutine, callback in listeners:
+            try:
+                if is_coroutine:
+                    await callback(action, repeat)
+                else:
+                    callback(action, repeat)
+            except Exception as e:
+                logger.error(f"Error in IR listener callback: {e}")
 
 
 class IRNavigationHandler:
@@ -534,16 +718,22 @@ class IRNavigationHandler:
     Bridges IR actions to UI focus navigation and controls.
     """
 
+    __slots__ = (
+        "_ir_service",
+        "_qml_bridge",
+        "_enabled",
+        "_send",
+    )
+
     def __init__(self, ir_service: IRRemoteService):
         self._ir_service = ir_service
         self._qml_bridge = None
         self._enabled = True
+        self._send: Callable[[str, Mapping[str, Any]], None] = _NOOP
 
         # Register navigation handlers
-        self._ir_service.add_listener(IRAction.UP, self._on_up)
-        self._ir_service.add_listener(IRAction.DOWN, self._on_down)
-        self._ir_service.add_listener(IRAction.LEFT, self._on_left)
-        self._ir_service.add_listener(IRAction.RIGHT, self._on_right)
+        for action in _NAV_PAYLOAD:
+            self._ir_service.add_listener(action, self._on_navigate)
         self._ir_service.add_listener(IRAction.OK, self._on_ok)
         self._ir_service.add_listener(IRAction.BACK, self._on_back)
         self._ir_service.add_listener(IRAction.HOME, self._on_home)
@@ -554,61 +744,58 @@ class IRNavigationHandler:
         self._ir_service.add_listener(IRAction.MUTE, self._on_mute)
 
         # Number keys
-        for i in range(10):
-            action = getattr(IRAction, f"NUM_{i}")
+        for action in _NUM_PAYLOAD:
             self._ir_service.add_listener(action, self._on_number)
 
     def set_qml_bridge(self, bridge) -> None:
         """Set QML bridge for sending events."""
         self._qml_bridge = bridge
+        self._update_sender()
 
     def set_enabled(self, enabled: bool) -> None:
         """Enable/disable IR navigation."""
         self._enabled = enabled
+        self._update_sender()
 
-    def _send_to_qml(self, event: str, data: Dict[str, Any] = None) -> None:
-        """Send event to QML."""
+    def _update_sender(self) -> None:
+        """Bind the QML sender once instead of checking state per event."""
         if self._qml_bridge and self._enabled:
-            self._qml_bridge.send_ir_event(event, data or {})
-
-    def _on_up(self, action: IRAction, repeat: int) -> None:
-        self._send_to_qml("navigate", {"direction": "up"})
-
-    def _on_down(self, action: IRAction, repeat: int) -> None:
-        self._send_to_qml("navigate", {"direction": "down"})
+            self._send = self._qml_bridge.send_ir_event
+        else:
+            self._send = _NOOP
 
-    def _on_left(self, action: IRAction, repeat: int) -> None:
-        self._send_to_qml("navigate", {"direction": "left"})
+    def _send_to_qml(self, event: str, data: Mapping[str, Any] = _EMPTY) -> None:
+        """Send event to QML."""
+        self._send(event, data)
 
-    def _on_right(self, action: IRAction, repeat: int) -> None:
-        self._send_to_qml("navigate", {"direction": "right"})
+    def _on_navigate(self, action: IRAction, repeat: int) -> None:
+        self._send("navigate", _NAV_PAYLOAD[action])
 
     def _on_ok(self, action: IRAction, repeat: int) -> None:
         if repeat == 0:  # Only on first press, not repeat
-            self._send_to_qml("select", {})
+            self._send("select", _EMPTY)
 
     def _on_back(self, action: IRAction, repeat: int) -> None:
         if repeat == 0:
-            self._send_to_qml("back", {})
+            self._send("back", _EMPTY)
 
     def _on_home(self, action: IRAction, repeat: int) -> None:
         if repeat == 0:
-            self._send_to_qml("home", {})
+            self._send("home", _EMPTY)
 
     def _on_volume_up(self, action: IRAction, repeat: int) -> None:
-        self._send_to_qml("volume", {"direction": "up"})
+        self._send("volume", _UP)
 
     def _on_volume_down(self, action: IRAction, repeat: int) -> None:
-        self._send_to_qml("volume", {"direction": "down"})
+        self._send("volume", _DOWN)
 
     def _on_mute(self, action: IRAction, repeat: int) -> None:
         if repeat == 0:
-            self._send_to_qml("mute", {})
+            self._send("mute", _EMPTY)
 
     def _on_number(self, action: IRAction, repeat: int) -> None:
         if repeat == 0:
-            number = int(action.value.split("_")[1])
-            self._send_to_qml("number", {"digit": number})
+            self._send("number", _NUM_PAYLOAD[action])
 
 
 class IRMeetingController:
@@ -618,6 +805,12 @@ class IRMeetingController:
     Maps IR actions to meeting control functions.
     """
 
+    __slots__ = (
+        "_ir_service",
+        "_meeting_service",
+        "_enabled",
+    )
+
     def __init__(self, ir_service: IRRemoteService):
         self._ir_service = ir_service
         self._meeting_service = None
@@ -0,0 +1,373 @@
+"""
+Tests for croom.security.api module.
+"""
+
+import base64
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+class TestCSRFProtection:
+    """Tests for CSRF token protection."""
+
+    def test_generate_and_validate(self):
+        """Test a generated token validates for its session."""
+        from croom.security.api import CSRFProtection
+
+        csrf = CSRFProtection("test-secret")
+        token = csrf.generate_token("session-1")
+
+        assert csrf.validate_token(token, "session-1") is True
+
+    def test_wrong_session(self):
+        """Test token is rejected for a different session."""
+        from croom.security.api import CSRFProtection
+
+        csrf = CSRFProtection("test-secret")
+        token = csrf.generate_token("session-1")
+
+        assert csrf.validate_token(token, "session-2") is False
+
+    def test_tampered_token(self):
+        """Test token with modified signature is rejected."""
+        from croom.security.api import CSRFProtection
+
+        csrf = CSRFProtection("test-secret")
+        decoded = bytearray(base64.urlsafe_b64decode(csrf.generate_token("session-1")))
+        decoded[-1] ^= 0x01
+        token = base64.urlsafe_b64encode(bytes(decoded)).decode('ascii')
+
+        assert csrf.validate_token(token, "session-1") is False
+
+    def test_garbage_token(self):
+        """Test malformed tokens are rejected."""
+        from croom.security.api import CSRFProtection
+
+        csrf = CSRFProtection("test-secret")
+
+        assert csrf.validate_token("not-a-token", "session-1") is False
+        assert csrf.validate_token("", "session-1") is False
+
+
+class TestInputValidator:
+    """Tests for input validation and sanitization."""
+
+    def test_sanitize_strips_control_chars(self):
+        """Test null bytes and control characters are removed."""
+        from croom.security.api import InputValidator
+
+        result = InputValidator.sanitize_string("a\x00b\x07c\x1fd\x7fe\tf\ng")
+        assert result == "abcde\tf\ng"
+
+    def test_sanitize_escapes_html(self):
+        """Test HTML is escaped after stripping."""
+        from croom.security.api import InputValidator
+
+        result = InputValidator.sanitize_string("<b>\x00hi</b>")
+        assert result == "&lt;b&gt;hi&lt;/b&gt;"
+
+    def test_sanitize_truncates(self):
+        """Test sanitized value is truncated to max_length."""
+        from croom.security.api import InputValidator
+
+        assert InputValidator.sanitize_string("abcdef", max_length=3) == "abc"
+
+    def test_validate_json(self):
+        """Test schema validation reports each violated constraint."""
+        from croom.security.api import InputValidator
+
+        schema = {
+            "required": ["name", "count"],
+            "properties": {
+                "name": {"type": "string", "minLength": 3, "pattern": r"^[a-z]+$"},
+                "count": {"type": "integer", "minimum": 1, "maximum": 10},
+                "mode": {"type": "string", "enum": ["auto", "manual"]},
+            },
+        }
+
+        assert InputValidator.validate_json({"name": "room", "count": 5}, schema) == (True, [])
+
+        valid, errors = InputValidator.validate_json(
+            {"name": "A", "count": 20, "mode": "other"}, schema
+        )
+        assert valid is False
+        assert errors == [
+            "Field 'name' must be at least 3 characters",
+            "Field 'name' does not match required pattern",
+            "Field 'count' must be at most 10",
+            "Field 'mode' must be one of: ['auto', 'manual']",
+        ]
+
+        valid, errors = InputValidator.validate_json({"count": "5"}, schema)
+        assert errors == [
+            "Missing required field: name",
+            "Field 'count' must be of type integer",
+        ]
+
+    def test_compile_schema_cached(self):
+        """Test compiled schemas are reused for the same schema object."""
+        from croom.security.api import InputValidator
+
+        schema = {"properties": {"name": {"type": "string"}}}
+
+        assert InputValidator.compile_schema(schema) is InputValidator.compile_schema(schema)
+
+    def test_validate_email(self):
+        """Test email format validation."""
+        from croom.security.api import InputValidator
+
+        assert InputValidator.validate_email("admin@example.com") == (True, None)
+        assert InputValidator.validate_email("not-an-email")[0] is False
+
+
+class TestRateLimiter:
+    """Tests for token bucket rate limiting."""
+
+    def test_allows_within_burst(self):
+        """Test requests within the burst size are allowed."""
+        from croom.security.api import RateLimitConfig, RateLimiter
+
+        limiter = RateLimiter(RateLimitConfig(burst_size=3))
+
+        for _ in range(3):
+            allowed, _ = limiter.check_limit("client")
+            assert allowed is True
+
+        allowed, info = limiter.check_limit("client")
+        assert allowed is False
+        assert info["reason"] == "burst_limit"
+
+    def test_get_limits_does_not_create_bucket(self):
+        """Test reading limits for an unknown client allocates nothing."""
+        from croom.security.api import RateLimitConfig, RateLimiter
+
+        limiter = RateLimiter(RateLimitConfig())
+        limits = limiter.get_limits("unknown")
+
+        assert limits["remaining_minute"] == 60
+        assert "unknown" not in limiter._buckets
+
+    def test_idle_buckets_evicted(self):
+        """Test buckets idle past the TTL are evicted."""
+        from croom.security.api import RateLimitConfig, RateLimiter
+
+        limiter = RateLimiter(RateLimitConfig())
+        limiter.EVICTION_INTERVAL = 1
+
+        with patch("croom.security.api.time.time", return_value=1000.0):
+            limiter.check_limit("stale")
+        with patch("croom.security.api.time.time", return_value=1000.0 + 3601):
+            limiter.check_limit("fresh")
+
+        assert list(limiter._buckets) == ["fresh"]
+
+
+class TestJWTService:
+    """Tests for JWT token service."""
+
+    @pytest.mark.parametrize("algorithm", ["HS256", "HS384", "HS512"])
+    def test_token_roundtrip(self, algorithm):
+        """Test tokens validate with each supported algorithm."""
+        from croom.security.api import JWTConfig, JWTService, TokenType
+
+        service = JWTService(JWTConfig(secret_key="secret", algorithm=algorithm))
+        token = service.create_access_token("user-1", scopes={"read"}, roles=["admin"])
+        payload = service.validate_token(token)
+
+        assert payload is not None
+        assert payload.sub == "user-1"
+        assert payload.token_type == TokenType.ACCESS
+        assert payload.scopes == {"read"}
+        assert payload.roles == ["admin"]
+
+    def test_wrong_secret_rejected(self):
+        """Test tokens signed with another secret are rejected."""
+        from croom.security.api import JWTConfig, JWTService
+
+        token = JWTService(JWTConfig(secret_key="one")).create_access_token("user-1")
+
+        assert JWTService(JWTConfig(secret_key="two")).validate_token(token) is None
+
+    def test_unsupported_algorithm(self):
+        """Test unknown algorithms are rejected at construction."""
+        from croom.security.api import JWTConfig, JWTService
+
+        with pytest.raises(ValueError):
+            JWTService(JWTConfig(secret_key="secret", algorithm="RS256"))
+
+    def test_revoke_token(self):
+        """Test revoked tokens no longer validate."""
+        from croom.security.api import JWTConfig, JWTService
+
+        service = JWTService(JWTConfig(secret_key="secret"))
+        token = service.create_access_token("user-1")
+
+        assert service.revoke_token(token) is True
+        assert service.validate_token(token) is None
+
+    def test_tampered_payload_rejected(self):
+        """Test tokens with a modified payload segment are rejected."""
+        from croom.security.api import JWTConfig, JWTService
+
+        service = JWTService(JWTConfig(secret_key="secret"))
+        header, payload, signature = service.create_access_token("user-1").split(".")
+        forged = service.create_access_token("user-2").split(".")[1]
+
+        assert service.validate_token(f"{header}.{forged}.{signature}") is None
+        assert service.validate_token(f"{header}.{payload}") is None
+
+    def test_check_reason_codes(self):
+        """Test the dict-free check path reports reason codes."""
+        from croom.security.api import RateLimitConfig, RateLimiter
+
+        limiter = RateLimiter(RateLimitConfig(burst_size=1))
+
+        assert limiter.check("client") == (True, RateLimiter.REASON_OK, 0)
+
+        allowed, reason, retry_after = limiter.check("client")
+        assert allowed is False
+        assert reason == RateLimiter.REASON_BURST_LIMIT
+        assert RateLimiter.REASON_NAMES[reason] == "burst_limit"
+        assert retry_after == 1
+
+
+class TestRevocationStore:
+    """Tests for token revocation backends."""
+
+    def test_in_memory_store_expires(self):
+        """Test in-memory revocations lapse after their TTL."""
+        from croom.security.api import InMemoryRevocationStore
+
+        store = InMemoryRevocationStore()
+        with patch("croom.security.api.time.time", return_value=1000.0):
+            store.revoke("jti-1", 60)
+            assert store.is_revoked("jti-1") is True
+            assert store.is_revoked("jti-2") is False
+        with patch("croom.security.api.time.time", return_value=1061.0):
+            assert store.is_revoked("jti-1") is False
+
+    def test_in_memory_store_purges_expired(self):
+        """Test revoking sweeps only expired entries, honouring re-revocations."""
+        from croom.security.api import InMemoryRevocationStore
+
+        store = InMemoryRevocationStore()
+        with patch("croom.security.api.time.time", return_value=1000.0):
+            store.revoke("short", 10)
+            store.revoke("extended", 10)
+            store.revoke("long", 600)
+        with patch("croom.security.api.time.time", return_value=1005.0):
+            store.revoke("extended", 600)
+        with patch("croom.security.api.time.time", return_value=1020.0):
+            store.revoke("new", 60)
+
+            assert set(store._revoked) == {"extended", "long", "new"}
+            assert store.is_revoked("extended") is True
+            assert len(store._expiries) == 3
+
+    def test_redis_store_caches_only_revocations(self):
+        """Test revoked lookups are cached locally but misses are re-checked."""
+        from croom.security.api import RedisRevocationStore
+
+        client = MagicMock()
+        client.exists.return_value = 0
+        store = RedisRevocationStore(client)
+
+        assert store.is_revoked("jti-1") is False
+        assert store.is_revoked("jti-1") is False
+        assert client.exists.call_count == 2
+
+        client.exists.return_value = 1
+        assert store.is_revoked("jti-1") is True
+        assert store.is_revoked("jti-1") is True
+        assert client.exists.call_count == 3
+
+    def test_redis_store_sees_other_worker_revocation(self):
+        """Test a revocation by another store sharing Redis is seen without pub/sub."""
+        from croom.security.api import RedisRevocationStore
+
+        keys = {}
+        client = MagicMock()
+        client.set.side_effect = lambda key, value, ex: keys.__setitem__(key, value)
+        client.exists.side_effect = lambda key: int(key in keys)
+        worker_a = RedisRevocationStore(client)
+        worker_b = RedisRevocationStore(client)
+
+        assert worker_a.is_revoked("jti-1") is False
+        worker_b.revoke("jti-1", 60)
+
+        assert worker_a.is_revoked("jti-1") is True
+
+    def test_redis_store_revoke_publishes(self):
+        """Test revocations are written to Redis and announced."""
+        from croom.security.api import RedisRevocationStore
+
+        client = MagicMock()
+        store = RedisRevocationStore(client)
+        store.revoke("jti-1", 120)
+
+        client.set.assert_called_once_with("croom:revoked:jti-1", 1, ex=120)
+        client.publish.assert_called_once_with("croom:revoked", "jti-1")
+        assert store.is_revoked("jti-1") is True
+        client.exists.assert_not_called()
+
+    def test_redis_store_message_invalidates_cache(self):
+        """Test a published revocation overrides a cached negative lookup."""
+        from croom.security.api import RedisRevocationStore
+
+        client = MagicMock()
+        client.exists.return_value = 0
+        store = RedisRevocationStore(client)
+
+        assert store.is_revoked("jti-1") is False
+        store._on_message({"type": "message", "data": b"jti-1"})
+        assert store.is_revoked("jti-1") is True
+
+    def test_jwt_service_uses_store(self):
+        """Test JWTService delegates revocation to the configured store."""
+        from croom.security.api import InMemoryRevocationStore, JWTConfig, JWTService
+
+        store = InMemoryRevocationStore()
+        issuer = JWTService(JWTConfig(secret_key="secret"), store)
+        other_worker = JWTService(JWTConfig(secret_key="secret"), store)
+        token = issuer.create_access_token("user-1")
+
+        issuer.revoke_token(token)
+        assert other_worker.validate_token(token) is None
+
+
+class TestAPISecurityService:
+    """Tests for the combined API security service."""
+
+    def test_authenticate_bearer(self):
+        """Test bearer tokens in the Authorization header authenticate."""
+        from croom.security.api import APISecurityService, JWTConfig
+
+        service = APISecurityService(JWTConfig(secret_key="secret"))
+        token = service.jwt.create_access_token("user-1")
+
+        payload = service.authenticate_request(f"Bearer {token}")
+        assert payload is not None
+        assert payload.sub == "user-1"
+
+    def test_authenticate_rejects_other_schemes(self):
+        """Test non-bearer and empty headers do not authenticate."""
+        from croom.security.api import APISecurityService, JWTConfig
+
+        service = APISecurityService(JWTConfig(secret_key="secret"))
+        token = service.jwt.create_access_token("user-1")
+
+        assert service.authenticate_request(f"Basic {token}") is None
+        assert service.authenticate_request("Bearer ") is None
+        assert service.authenticate_request(None) is None
+
+    def test_authenticate_api_key(self):
+        """Test the API key header is used when no bearer token is sent."""
+        from croom.security.api import APISecurityService, JWTConfig
+
+        service = APISecurityService(JWTConfig(secret_key="secret"))
+        api_key = service.jwt.create_api_key("service-1")
+
+        payload = service.authenticate_request(None, api_key_header=api_key)
+        assert payload is not None
+        assert payload.sub == "service-1"
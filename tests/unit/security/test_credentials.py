@@ -0,0 +1,32 @@
+"""
+Tests for croom.security.credentials module.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+
+class TestCredentialVault:
+    """Tests for the encrypted credential vault."""
+
+    def test_change_master_password(self, tmp_path, monkeypatch):
+        """Test the old password is checked uncached and only its key is evicted."""
+        pytest.importorskip("argon2")
+        from croom.security import encryption
+        from croom.security.credentials import CredentialType, CredentialVault
+
+        monkeypatch.setattr(encryption, "_kdf_cache", encryption.OrderedDict())
+        other = CredentialVault(tmp_path / "other", master_password="other")
+        vault = CredentialVault(tmp_path / "vault", master_password="old")
+        credential = vault.store(CredentialType.API_KEY, "api", {"key": "secret"})
+        assert len(encryption._kdf_cache) == 2
+
+        with patch.object(
+            encryption.KeyDerivation, "derive_key_cached", side_effect=AssertionError
+        ):
+            assert vault.change_master_password("wrong", "new") is False
+            assert vault.change_master_password("old", "new") is True
+
+        assert [d.key for d in encryption._kdf_cache.values()] == [other._encryption_key]
+        assert vault.retrieve(credential.credential_id) == {"key": "secret"}
@@ -0,0 +1,500 @@
+"""
+Tests for croom.security.encryption module.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+try:
+    import cryptography  # noqa: F401
+    HAS_CRYPTOGRAPHY = True
+except ImportError:
+    HAS_CRYPTOGRAPHY = False
+
+requires_cryptography = pytest.mark.skipif(
+    not HAS_CRYPTOGRAPHY, reason="cryptography not installed"
+)
+
+
+@requires_cryptography
+class TestEncryptionService:
+    """Tests for AES-256-GCM encryption service."""
+
+    def test_roundtrip(self):
+        """Test data encrypts and decrypts with associated data."""
+        from croom.security.encryption import EncryptionService
+
+        service = EncryptionService()
+        ciphertext = service.encrypt("secret", b"aad")
+
+        assert service.decrypt(ciphertext, b"aad") == b"secret"
+
+    def test_wrong_associated_data(self):
+        """Test mismatched associated data fails authentication."""
+        from croom.security.encryption import EncryptionService
+
+        service = EncryptionService()
+        ciphertext = service.encrypt(b"secret", b"aad")
+
+        with pytest.raises(ValueError):
+            service.decrypt(ciphertext, b"other")
+
+    def test_cipher_reused(self):
+        """Test one AEAD instance serves every operation."""
+        from croom.security.encryption import EncryptionService
+
+        service = EncryptionService()
+        aead = service._aead
+
+        for i in range(3):
+            assert service.decrypt(service.encrypt(bytes([i]))) == bytes([i])
+        assert service._aead is aead
+
+    @pytest.mark.parametrize("associated_data", [None, b"aad"])
+    def test_encrypt_format(self, associated_data):
+        """Test ciphertext is nonce || ciphertext || tag as immutable bytes."""
+        import os
+
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        from croom.security.encryption import NONCE_SIZE, EncryptionService
+
+        service = EncryptionService()
+        plaintext = os.urandom(4096)
+
+        ciphertext = service.encrypt(plaintext, associated_data)
+
+        assert type(ciphertext) is bytes
+        assert len(ciphertext) == NONCE_SIZE + len(plaintext) + 16
+        assert service.decrypt(ciphertext, associated_data) == plaintext
+        assert AESGCM(service.key).decrypt(
+            ciphertext[:NONCE_SIZE], ciphertext[NONCE_SIZE:], associated_data
+        ) == plaintext
+
+    def test_nonces_from_pool(self):
+        """Test nonces are unique and drawn from one urandom call per refill."""
+        import os
+
+        from croom.security import encryption
+
+        service = encryption.EncryptionService()
+        count = encryption.NONCE_POOL_SIZE // encryption.NONCE_SIZE + 1
+
+        with patch.object(encryption, "_urandom", wraps=os.urandom) as urandom:
+            nonces = {service._next_nonce() for _ in range(count)}
+
+        assert len(nonces) == count
+        assert urandom.call_count == 2
+
+    def test_nonce_pool_refilled_after_fork(self, monkeypatch):
+        """Test a forked child does not reuse the parent's pooled nonces."""
+        from croom.security import encryption
+
+        service = encryption.EncryptionService()
+        service._next_nonce()
+        inherited = service._nonce_pool
+
+        monkeypatch.setattr(encryption, "_fork_generation", encryption._fork_generation + 1)
+        service._next_nonce()
+
+        assert service._nonce_pool is not inherited
+        assert service._nonce_offset == encryption.NONCE_SIZE
+
+    def test_key_wiped_on_delete(self):
+        """Test the service's copy of the key is zeroed when it is collected."""
+        import gc
+
+        from croom.security.encryption import KEY_SIZE, EncryptionService
+
+        key = EncryptionService.generate_key()
+        service = EncryptionService(key)
+        held = service._key
+
+        assert service.key == key
+        del service
+        gc.collect()
+
+        assert held == bytearray(KEY_SIZE)
+        assert key != bytes(KEY_SIZE)
+
+    @pytest.mark.parametrize("name", ["aes-gcm", "chacha20-poly1305", "aes-gcm-siv"])
+    def test_algorithms_roundtrip(self, name):
+        """Test every supported AEAD round-trips in the same wire format."""
+        from croom.security.encryption import (
+            NONCE_SIZE,
+            TAG_SIZE,
+            CipherAlgorithm,
+            EncryptionService,
+        )
+
+        algorithm = CipherAlgorithm(name)
+        service = EncryptionService(algorithm=algorithm)
+        ciphertext = service.encrypt(b"key material", b"aad")
+
+        assert service.algorithm is algorithm
+        assert len(ciphertext) == NONCE_SIZE + len(b"key material") + TAG_SIZE
+        assert service.decrypt(ciphertext, b"aad") == b"key material"
+
+    @pytest.mark.parametrize("ghash, expected", [(True, "aes-gcm"), (False, "chacha20-poly1305")])
+    def test_auto_algorithm(self, ghash, expected):
+        """Test ChaCha20-Poly1305 is chosen when GHASH is not accelerated."""
+        from croom.security import encryption
+
+        with patch.object(
+            encryption, "_probe_acceleration", return_value={"ghash": ghash}
+        ):
+            service = encryption.EncryptionService(algorithm=None)
+
+        assert service.algorithm.value == expected
+
+    def test_invalid_key_size(self):
+        """Test keys of the wrong length are rejected."""
+        from croom.security.encryption import EncryptionService
+
+        with pytest.raises(ValueError):
+            EncryptionService(b"short")
+
+    def test_requires_cryptography(self):
+        """Test construction fails fast without the cryptography package."""
+        from croom.security.encryption import EncryptionService
+
+        with patch("croom.security.encryption.CRYPTOGRAPHY_AVAILABLE", False):
+            with pytest.raises(RuntimeError):
+                EncryptionService()
+
+
+class TestSecureZero:
+    """Tests for wiping key material."""
+
+    def test_clears_in_place(self):
+        """Test secure_zero clears a buffer in place."""
+        from croom.security.encryption import secure_zero
+
+        buffer = bytearray(b"secret")
+        secure_zero(buffer)
+        secure_zero(bytearray())
+
+        assert buffer == bytearray(6)
+
+
+class TestKeyDerivation:
+    """Tests for password-based key derivation."""
+
+    def test_pbkdf2_known_vector(self):
+        """Test PBKDF2-SHA256 matches the RFC 7914 test vector."""
+        from croom.security.encryption import KeyDerivation, KeyDerivationAlgorithm
+
+        derived = KeyDerivation.derive_pbkdf2("passwd", b"salt", iterations=1)
+
+        assert derived.key.hex() == (
+            "55ac046e56e3089fec1691c22544b605f94185216dde0465e68b9d57c20dacbc"
+        )
+        assert derived.algorithm == KeyDerivationAlgorithm.PBKDF2_SHA256
+
+    @requires_cryptography
+    @pytest.mark.parametrize("dklen", [None, 16, 64])
+    def test_cryptography_pbkdf2_matches_hashlib(self, dklen):
+        """Test the cryptography PBKDF2 backend matches hashlib exactly."""
+        import hashlib
+
+        from croom.security.encryption import _cryptography_pbkdf2_hmac
+
+        assert _cryptography_pbkdf2_hmac("sha256", b"pw", b"salt", 50, dklen) == (
+            hashlib.pbkdf2_hmac("sha256", b"pw", b"salt", 50, dklen)
+        )
+
+    def test_pbkdf2_generates_salt(self):
+        """Test a random salt is generated when none is given."""
+        from croom.security.encryption import SALT_SIZE, KeyDerivation
+
+        first = KeyDerivation.derive_pbkdf2("password", iterations=1)
+        second = KeyDerivation.derive_pbkdf2("password", iterations=1)
+
+        assert len(first.salt) == SALT_SIZE
+        assert first.key != second.key
+
+    @pytest.mark.parametrize("use_cryptography", [True, False])
+    def test_scrypt_known_vector(self, use_cryptography):
+        """Test scrypt matches the RFC 7914 test vector on both backends."""
+        from croom.security import encryption
+
+        if use_cryptography and not encryption.CRYPTOGRAPHY_AVAILABLE:
+            pytest.skip("cryptography not installed")
+
+        with patch.object(encryption, "CRYPTOGRAPHY_AVAILABLE", use_cryptography):
+            derived = encryption.KeyDerivation.derive_scrypt(
+                "password", b"NaCl", n=1024, r=8, p=16
+            )
+
+        assert derived.key.hex() == (
+            "fdbabe1c9d3472007856e7190d01e9fe7c6ad7cbc8237830e77376634b373162"
+        )
+
+    def test_scrypt_default_cost(self):
+        """Test the default scrypt cost is not rejected by memory limits."""
+        from croom.security.encryption import KEY_SIZE, KeyDerivation
+
+        assert len(KeyDerivation.derive_scrypt("password", b"salt").key) == KEY_SIZE
+
+    def test_cached_with_explicit_salt(self, monkeypatch):
+        """Test repeated cached derivations with the same inputs skip the KDF."""
+        from croom.security import encryption
+
+        monkeypatch.setattr(encryption, "_kdf_cache", encryption.OrderedDict())
+        pbkdf2 = encryption.KeyDerivationAlgorithm.PBKDF2_SHA256
+        derive = encryption.KeyDerivation.derive_key_cached
+
+        with patch.object(
+            encryption, "_pbkdf2_hmac", wraps=encryption._pbkdf2_hmac
+        ) as kdf:
+            first = derive("pw", b"salt", pbkdf2, iterations=5)
+            second = derive("pw", b"salt", pbkdf2, iterations=5)
+            derive(b"pw", b"salt", pbkdf2, iterations=6)
+            derive("other", b"salt", pbkdf2, iterations=5)
+
+        assert second.key == first.key
+        assert second is not first
+        assert kdf.call_count == 3
+        assert b"pw" not in b"".join(encryption._kdf_cache)
+
+        encryption.clear_kdf_cache()
+        assert len(encryption._kdf_cache) == 0
+
+    def test_clear_cache_by_key(self, monkeypatch):
+        """Test evicting one derived key leaves other cached entries alone."""
+        from croom.security import encryption
+
+        monkeypatch.setattr(encryption, "_kdf_cache", encryption.OrderedDict())
+        pbkdf2 = encryption.KeyDerivationAlgorithm.PBKDF2_SHA256
+
+        first = encryption.KeyDerivation.derive_key_cached("a", b"salt", pbkdf2, iterations=1)
+        encryption.KeyDerivation.derive_key_cached("b", b"salt", pbkdf2, iterations=1)
+
+        encryption.clear_kdf_cache(first.key)
+
+        assert len(encryption._kdf_cache) == 1
+        assert all(d.key != first.key for d in encryption._kdf_cache.values())
+
+    def test_plain_derivation_not_cached(self, monkeypatch):
+        """Test the public KDFs never keep derived keys around."""
+        from croom.security import encryption
+
+        monkeypatch.setattr(encryption, "_kdf_cache", encryption.OrderedDict())
+
+        with patch.object(
+            encryption, "_pbkdf2_hmac", wraps=encryption._pbkdf2_hmac
+        ) as kdf:
+            encryption.KeyDerivation.derive_pbkdf2("pw", b"salt", iterations=5)
+            encryption.KeyDerivation.derive_pbkdf2("pw", b"salt", iterations=5)
+
+        assert kdf.call_count == 2
+        assert len(encryption._kdf_cache) == 0
+
+    def test_cache_bounded(self, monkeypatch):
+        """Test the least recently used derivation is evicted."""
+        from croom.security import encryption
+
+        monkeypatch.setattr(encryption, "_kdf_cache", encryption.OrderedDict())
+        monkeypatch.setattr(encryption, "KDF_CACHE_SIZE", 2)
+
+        for salt in (b"a", b"b", b"c"):
+            encryption.KeyDerivation.derive_key_cached(
+                "pw", salt, encryption.KeyDerivationAlgorithm.PBKDF2_SHA256, iterations=1
+            )
+
+        assert len(encryption._kdf_cache) == 2
+
+    def test_argon2_auto_parallelism(self):
+        """Test parallelism=None uses one lane per CPU up to the cap."""
+        pytest.importorskip("argon2")
+        from croom.security.encryption import KeyDerivation, KeyDerivationAlgorithm
+
+        params = {"time_cost": 1, "memory_cost": 256}
+        with patch("croom.security.encryption.os.cpu_count", return_value=64):
+            auto = KeyDerivation.derive_argon2("pw", b"saltsalt", parallelism=None, **params)
+        capped = KeyDerivation.derive_argon2("pw", b"saltsalt", parallelism=8, **params)
+        default = KeyDerivation.derive_argon2("pw", b"saltsalt", **params)
+
+        assert auto.algorithm == KeyDerivationAlgorithm.ARGON2ID
+        assert auto.key == capped.key
+        assert default.key != capped.key
+
+
+class TestAccelerationProbe:
+    """Tests for the hardware acceleration probe."""
+
+    @pytest.fixture(autouse=True)
+    def reset_probe(self, monkeypatch):
+        monkeypatch.setattr("croom.security.encryption._acceleration", None)
+
+    def test_x86_flags(self, caplog):
+        """Test x86 AES-NI, PCLMULQDQ and SHA-NI flags are recognised."""
+        from croom.security import encryption
+
+        with patch.object(
+            encryption, "_read_cpu_flags", return_value={"aes", "pclmulqdq", "avx2"}
+        ):
+            result = encryption._probe_acceleration()
+
+        assert result == {"aes": True, "ghash": True, "sha256": False}
+        assert "sha256" in caplog.text
+
+    def test_arm_flags(self):
+        """Test ARMv8 crypto extension flags are recognised."""
+        from croom.security import encryption
+
+        with patch.object(
+            encryption, "_read_cpu_flags", return_value={"aes", "pmull", "sha2"}
+        ):
+            assert all(encryption._probe_acceleration().values())
+
+    def test_probed_once(self):
+        """Test CPU flags are read once per process."""
+        from croom.security import encryption
+
+        with patch.object(encryption, "_read_cpu_flags", return_value=None) as read:
+            encryption._probe_acceleration()
+            encryption._probe_acceleration()
+
+        read.assert_called_once()
+
+
+@requires_cryptography
+class TestFileKeyStorage:
+    """Tests for encrypted file-based key storage."""
+
+    def test_store_and_retrieve(self, temp_dir):
+        """Test a stored key round-trips and can be deleted."""
+        from croom.security.encryption import EncryptionService, FileKeyStorage
+
+        storage = FileKeyStorage(temp_dir / "keys", EncryptionService.generate_key())
+        key = EncryptionService.generate_key()
+
+        assert storage.store_key("device", key) is True
+        assert storage.key_exists("device") is True
+        assert storage.retrieve_key("device") == key
+
+        assert storage.delete_key("device") is True
+        assert storage.retrieve_key("device") is None
+
+    def test_large_key_file_mapped(self, temp_dir):
+        """Test entries above the mmap threshold are decrypted from a mapping."""
+        import mmap
+        import os
+
+        from croom.security.encryption import EncryptionService, FileKeyStorage
+
+        storage = FileKeyStorage(temp_dir / "keys", EncryptionService.generate_key())
+        blob = os.urandom(4096)
+        storage.store_key("bundle", blob)
+
+        with patch("croom.security.encryption.MMAP_THRESHOLD", 1024), patch(
+            "croom.security.encryption.mmap.mmap", wraps=mmap.mmap
+        ) as mapped:
+            assert storage.retrieve_key("bundle") == blob
+
+        mapped.assert_called_once()
+
+    def test_retrieve_keys(self, temp_dir):
+        """Test batch retrieval returns stored keys and omits missing ones."""
+        from croom.security.encryption import EncryptionService, FileKeyStorage
+
+        storage = FileKeyStorage(temp_dir / "keys", EncryptionService.generate_key())
+        keys = {f"key-{i}": EncryptionService.generate_key() for i in range(5)}
+        for key_id, key in keys.items():
+            storage.store_key(key_id, key)
+
+        assert storage.retrieve_keys(list(keys) + ["missing"]) == keys
+        assert storage.retrieve_keys(["key-0"]) == {"key-0": keys["key-0"]}
+        assert storage.retrieve_keys([]) == {}
+
+    def test_legacy_key_file_migrated(self, temp_dir):
+        """Test keys stored under the old SHA-256 file name are still found."""
+        import hashlib
+
+        from croom.security.encryption import EncryptionService, FileKeyStorage
+
+        storage = FileKeyStorage(temp_dir / "keys", EncryptionService.generate_key())
+        key = EncryptionService.generate_key()
+        storage.store_key("device", key)
+
+        legacy_path = temp_dir / "keys" / f"{hashlib.sha256(b'device').hexdigest()}.key"
+        storage._key_path("device").rename(legacy_path)
+
+        assert storage.retrieve_key("device") == key
+        assert not legacy_path.exists()
+        assert storage._key_path("device").name == (
+            f"{hashlib.blake2b(b'device', digest_size=16).hexdigest()}.key"
+        )
+
+    @pytest.mark.parametrize("rotational", [True, False])
+    def test_delete_overwrites_only_on_rotational(self, temp_dir, rotational):
+        """Test key files are only overwritten before unlink on spinning disks."""
+        from croom.security.encryption import EncryptionService, FileKeyStorage
+
+        with patch("croom.security.encryption._is_rotational", return_value=rotational):
+            storage = FileKeyStorage(temp_dir / "keys", EncryptionService.generate_key())
+        storage.store_key("device", EncryptionService.generate_key())
+
+        with patch(
+            "croom.security.encryption.secrets.token_bytes", return_value=bytes(256)
+        ) as overwrite:
+            assert storage.delete_key("device") is True
+
+        assert overwrite.called is rotational
+        assert storage.key_exists("device") is False
+
+
+class TestRotationalDetection:
+    """Tests for spinning-disk detection."""
+
+    def test_unknown_device_is_rotational(self, temp_dir):
+        """Test devices without sysfs queue info are treated as rotational."""
+        from croom.security.encryption import _is_rotational
+
+        with patch("croom.security.encryption.os.path.exists", return_value=False):
+            assert _is_rotational(temp_dir) is True
+
+    def test_missing_path_is_rotational(self, temp_dir):
+        """Test unreadable paths are treated as rotational."""
+        from croom.security.encryption import _is_rotational
+
+        assert _is_rotational(temp_dir / "missing") is True
+
+
+class TestLinuxKeyringStorage:
+    """Tests for Secret Service keyring storage."""
+
+    @pytest.fixture
+    def keyring(self):
+        """Provide a fake secretstorage module and its default collection."""
+        module = MagicMock()
+        collection = module.get_default_collection.return_value
+        with patch.dict("sys.modules", {"secretstorage": module}):
+            yield collection
+
+    def test_stores_raw_bytes(self, keyring):
+        """Test keys are stored as raw bytes without base64."""
+        from croom.security.encryption import LinuxKeyringStorage
+
+        assert LinuxKeyringStorage().store_key("device", b"\x00\xffkey") is True
+
+        args, kwargs = keyring.create_item.call_args
+        assert args[2] == b"\x00\xffkey"
+        assert kwargs["content_type"] == "application/octet-stream"
+
+    @pytest.mark.parametrize("content_type, secret", [
+        ("application/octet-stream", b"\x00\xffkey"),
+        ("text/plain", b"AP9rZXk="),
+    ])
+    def test_retrieves_raw_and_legacy(self, keyring, content_type, secret):
+        """Test raw items and base64 items from older releases both load."""
+        from croom.security.encryption import LinuxKeyringStorage
+
+        item = MagicMock()
+        item.get_secret.return_value = secret
+        item.get_secret_content_type.return_value = content_type
+        keyring.search_items.return_value = [item]
+
+        assert LinuxKeyringStorage().retrieve_key("device") == b"\x00\xffkey"
@@ -0,0 +1,515 @@
+"""
+Tests for croom.security.sso module.
+"""
+
+import base64
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+SAML_RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
+<samlp:Response xmlns:samlp="urn:oasis:names:tc:SAML:2.0:protocol"
+    xmlns:saml="urn:oasis:names:tc:SAML:2.0:assertion"
+    xmlns:ds="http://www.w3.org/2000/09/xmldsig#" ID="_resp" Version="2.0">
+    <samlp:Status>
+        <samlp:StatusCode Value="urn:oasis:names:tc:SAML:2.0:status:{status}"/>
+    </samlp:Status>
+    <saml:Assertion ID="_assertion" Version="2.0">
+        {signature}
+        <saml:Subject>
+            <saml:NameID>jdoe@example.com</saml:NameID>
+        </saml:Subject>
+        <saml:AttributeStatement>
+            <saml:Attribute Name="http://schemas.xmlsoap.org/ws/2005/05/identity/claims/givenname">
+                <saml:AttributeValue>Jane</saml:AttributeValue>
+            </saml:Attribute>
+            <saml:Attribute Name="http://schemas.microsoft.com/ws/2008/06/identity/claims/groups">
+                <saml:AttributeValue>staff</saml:AttributeValue>
+                <saml:AttributeValue>admins</saml:AttributeValue>
+            </saml:Attribute>
+        </saml:AttributeStatement>
+    </saml:Assertion>
+</samlp:Response>"""
+
+SIGNATURE = "<ds:Signature><ds:SignatureValue>sig</ds:SignatureValue></ds:Signature>"
+
+
+def _encode_response(status="Success", signature=SIGNATURE):
+    xml = SAML_RESPONSE.format(status=status, signature=signature)
+    return base64.b64encode(xml.encode('utf-8')).decode('ascii')
+
+
+def _saml_authenticator(**overrides):
+    from croom.security.sso import SAMLAuthenticator, SAMLConfig
+
+    config = SAMLConfig(
+        entity_id="https://croom.example.com",
+        sso_url="https://idp.example.com/sso",
+        acs_url="https://croom.example.com/acs",
+        **overrides,
+    )
+    return SAMLAuthenticator(config)
+
+
+@pytest.fixture(params=["lxml", "etree"])
+def xml_backend(request):
+    """Run a test against both the lxml and ElementTree parsing paths."""
+    from croom.security import sso
+
+    if request.param == "lxml" and not sso.LXML_AVAILABLE:
+        pytest.skip("lxml not installed")
+    if request.param == "etree":
+        with patch.object(sso, "LXML_AVAILABLE", False):
+            yield request.param
+    else:
+        yield request.param
+
+
+class TestSAMLAuthenticator:
+    """Tests for SAML response processing."""
+
+    async def test_process_callback(self, xml_backend):
+        """Test a successful response yields the mapped user."""
+        from croom.security.sso import SSOProvider
+
+        authenticator = _saml_authenticator()
+        user = await authenticator.process_callback({"SAMLResponse": _encode_response()})
+
+        assert user is not None
+        assert user.user_id == "jdoe@example.com"
+        assert user.email == "jdoe@example.com"
+        assert user.given_name == "Jane"
+        assert user.groups == ["staff", "admins"]
+        assert user.provider == SSOProvider.SAML
+
+    async def test_attributes_collected(self, xml_backend):
+        """Test values attach to their own attribute and empty ones are dropped."""
+        authenticator = _saml_authenticator()
+        xml = SAML_RESPONSE.format(status="Success", signature=SIGNATURE).replace(
+            "</saml:AttributeStatement>",
+            '<saml:Attribute Name="empty"><saml:AttributeValue/></saml:Attribute>'
+            '<saml:Attribute Name="dept"><saml:AttributeValue>R&amp;D</saml:AttributeValue>'
+            "</saml:Attribute></saml:AttributeStatement>",
+        )
+        response = base64.b64encode(xml.encode('utf-8')).decode('ascii')
+
+        user = await authenticator.process_callback({"SAMLResponse": response})
+        assert user.attributes["dept"] == "R&D"
+        assert "empty" not in user.attributes
+        assert user.groups == ["staff", "admins"]
+
+    async def test_comment_split_text(self, xml_backend):
+        """Test comments inside values cannot truncate the NameID or attributes."""
+        authenticator = _saml_authenticator()
+        xml = SAML_RESPONSE.format(status="Success", signature=SIGNATURE).replace(
+            "<saml:NameID>jdoe@example.com</saml:NameID>",
+            "<saml:NameID>admin@corp.com<!---->.evil.com</saml:NameID>",
+        ).replace(
+            "<saml:AttributeValue>Jane</saml:AttributeValue>",
+            "<saml:AttributeValue>a<!---->b<?pi x?>c</saml:AttributeValue>",
+        )
+        response = base64.b64encode(xml.encode('utf-8')).decode('ascii')
+
+        user = await authenticator.process_callback({"SAMLResponse": response})
+        assert user.user_id == "admin@corp.com.evil.com"
+        assert user.given_name == "abc"
+
+    async def test_failed_status(self, xml_backend):
+        """Test a non-success status code is rejected."""
+        authenticator = _saml_authenticator()
+        response = _encode_response(status="Requester")
+
+        assert await authenticator.process_callback({"SAMLResponse": response}) is None
+
+    async def test_missing_signature(self, xml_backend):
+        """Test unsigned responses are rejected when signing is required."""
+        authenticator = _saml_authenticator()
+        response = _encode_response(signature="")
+
+        assert await authenticator.process_callback({"SAMLResponse": response}) is None
+
+    async def test_unsigned_allowed(self, xml_backend):
+        """Test unsigned responses pass when signing is not required."""
+        authenticator = _saml_authenticator(want_signed_response=False)
+        response = _encode_response(signature="")
+
+        user = await authenticator.process_callback({"SAMLResponse": response})
+        assert user is not None
+
+    async def test_doctype_rejected(self, xml_backend):
+        """Test responses declaring a DTD are refused before expansion."""
+        authenticator = _saml_authenticator(want_signed_response=False)
+        xml = SAML_RESPONSE.format(status="Success", signature="").replace(
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<!DOCTYPE r [<!ENTITY a "aaaaaaaaaa"><!ENTITY b "&a;&a;&a;&a;&a;">]>',
+        ).replace("Jane", "&b;")
+        response = base64.b64encode(xml.encode('utf-8')).decode('ascii')
+
+        assert await authenticator.process_callback({"SAMLResponse": response}) is None
+
+    async def test_missing_response(self):
+        """Test callbacks without a SAMLResponse are rejected."""
+        authenticator = _saml_authenticator()
+
+        assert await authenticator.process_callback({}) is None
+
+    async def test_non_utf8_response(self, xml_backend):
+        """Test the declared document encoding is honoured."""
+        authenticator = _saml_authenticator()
+        xml = SAML_RESPONSE.format(status="Success", signature=SIGNATURE)
+        xml = xml.replace('encoding="UTF-8"', 'encoding="ISO-8859-1"').replace("Jane", "Ren\xe9e")
+        response = base64.b64encode(xml.encode('iso-8859-1')).decode('ascii')
+
+        user = await authenticator.process_callback({"SAMLResponse": response})
+        assert user is not None
+        assert user.given_name == "Ren\xe9e"
+
+    def test_login_url_raw_deflate(self):
+        """Test the redirect-binding request inflates as raw DEFLATE."""
+        import urllib.parse
+        import zlib
+
+        authenticator = _saml_authenticator()
+        url = authenticator.get_login_url(state="relay")
+        params = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)
+
+        request_xml = zlib.decompress(base64.b64decode(params["SAMLRequest"][0]), -15)
+        assert b"<samlp:AuthnRequest" in request_xml
+        assert b"https://croom.example.com/acs" in request_xml
+        assert params["RelayState"] == ["relay"]
+
+    def test_authn_request_fields(self):
+        """Test per-request fields are placed into the cached template."""
+        authenticator = _saml_authenticator()
+        request_xml = authenticator._build_authn_request("_abc123")
+
+        assert 'ID="_abc123"' in request_xml
+        assert 'Destination="https://idp.example.com/sso"' in request_xml
+        assert "<saml:Issuer>https://croom.example.com</saml:Issuer>" in request_xml
+
+    def test_metadata(self):
+        """Test SP metadata reflects the configuration."""
+        authenticator = _saml_authenticator(signed_requests=False)
+        metadata = authenticator.get_metadata()
+
+        assert 'entityID="https://croom.example.com"' in metadata
+        assert 'AuthnRequestsSigned="false"' in metadata
+        assert 'Location="https://croom.example.com/acs"' in metadata
+        assert authenticator.get_metadata() is metadata
+
+
+def _oidc_authenticator(**overrides):
+    from croom.security.sso import OIDCAuthenticator, OIDCConfig
+
+    config = OIDCConfig(
+        client_id="croom",
+        client_secret="secret",
+        issuer="https://idp.example.com",
+        authorization_endpoint="https://idp.example.com/authorize",
+        token_endpoint="https://idp.example.com/token",
+        redirect_uri="https://croom.example.com/callback",
+        **overrides,
+    )
+    return OIDCAuthenticator(config)
+
+
+class TestOIDCAuthenticator:
+    """Tests for the OpenID Connect authenticator."""
+
+    def test_login_url(self):
+        """Test the authorization URL carries static and per-request params."""
+        import urllib.parse
+
+        authenticator = _oidc_authenticator()
+        url = authenticator.get_login_url(state="a b&c")
+        parts = urllib.parse.urlsplit(url)
+        params = urllib.parse.parse_qs(parts.query)
+
+        assert f"{parts.scheme}://{parts.netloc}{parts.path}" == "https://idp.example.com/authorize"
+        assert params["client_id"] == ["croom"]
+        assert params["redirect_uri"] == ["https://croom.example.com/callback"]
+        assert params["response_type"] == ["code"]
+        assert params["scope"] == ["openid email profile"]
+        assert params["state"] == ["a b&c"]
+        assert params["nonce"] == [authenticator._pending_states.pop("a b&c")[1]]
+
+    @pytest.fixture
+    def aiohttp(self):
+        """Provide a fake aiohttp module whose sessions return JSON bodies."""
+        module = MagicMock()
+        session = module.ClientSession.return_value
+        session.closed = False
+        session.close = AsyncMock()
+
+        response = MagicMock(status=200)
+        response.json = AsyncMock(return_value={"access_token": "token"})
+        session.post.return_value.__aenter__ = AsyncMock(return_value=response)
+        session.post.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("croom.security.sso.aiohttp", module), \
+                patch("croom.security.sso.AIOHTTP_AVAILABLE", True):
+            yield module
+
+    async def test_session_reused(self, aiohttp):
+        """Test token exchanges share one HTTP session until closed."""
+        authenticator = _oidc_authenticator()
+
+        assert await authenticator._exchange_code("code-1") == {"access_token": "token"}
+        assert await authenticator._exchange_code("code-2") == {"access_token": "token"}
+        aiohttp.ClientSession.assert_called_once()
+
+        await authenticator.aclose()
+        aiohttp.ClientSession.return_value.close.assert_awaited_once()
+        assert authenticator._session is None
+
+    def test_parse_jwt(self):
+        """Test ID token claims are decoded from the payload segment."""
+        import json
+
+        authenticator = _oidc_authenticator()
+        payload = base64.urlsafe_b64encode(
+            json.dumps({"sub": "user-1", "nonce": "n"}).encode()
+        ).rstrip(b"=").decode()
+
+        assert authenticator._parse_jwt(f"header.{payload}.sig") == {"sub": "user-1", "nonce": "n"}
+        assert authenticator._parse_jwt(f"header.{payload}") == {}
+        assert authenticator._parse_jwt(f"header.{payload}.sig.extra") == {}
+
+    @pytest.mark.parametrize("name", ["a", "ab", "abc", "abcd"])
+    def test_parse_jwt_padding(self, name):
+        """Test payloads of every length modulo four decode."""
+        import json
+
+        authenticator = _oidc_authenticator()
+        claims = {"sub": name}
+        payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+
+        assert authenticator._parse_jwt(f"h.{payload}.s") == claims
+
+
+class TestPendingLogins:
+    """Tests for the bounded pending-login store."""
+
+    def test_evicts_oldest_over_limit(self):
+        """Test the oldest entries are dropped past the size limit."""
+        from croom.security.sso import _PendingLogins
+
+        pending = _PendingLogins(max_size=2)
+        for key in ("a", "b", "c"):
+            pending.add(key, key.upper())
+
+        assert len(pending) == 2
+        assert "a" not in pending
+        assert pending.pop("c")[1] == "C"
+        assert pending.pop("c") is None
+
+    def test_evicts_expired(self):
+        """Test entries older than the TTL are dropped on insert."""
+        from croom.security.sso import _PendingLogins
+
+        pending = _PendingLogins(ttl=600)
+
+        with patch("croom.security.sso.time.monotonic_ns") as clock:
+            clock.return_value = 0
+            pending.add("stale")
+            clock.return_value = 601 * 1_000_000_000
+            pending.add("fresh")
+
+            assert "stale" not in pending
+            assert "fresh" in pending
+
+    async def test_expired_state_rejected(self):
+        """Test an OIDC callback with an expired state is rejected."""
+        authenticator = _oidc_authenticator()
+
+        with patch("croom.security.sso.time.monotonic_ns") as clock:
+            clock.return_value = 0
+            authenticator.get_login_url(state="s1")
+            clock.return_value = 601 * 1_000_000_000
+
+            user = await authenticator.process_callback({"state": "s1", "code": "c"})
+
+        assert user is None
+        assert "s1" not in authenticator._pending_states
+
+
+class TestLDAPAuthenticator:
+    """Tests for LDAP authentication."""
+
+    @pytest.fixture
+    def ldap3(self):
+        """Provide a fake ldap3 module whose connections bind and find one user."""
+        module = MagicMock()
+        user_entry = MagicMock(entry_dn="uid=jdoe,dc=example,dc=com")
+        user_entry.uid = "jdoe"
+        user_entry.mail = "jdoe@example.com"
+        user_entry.displayName = "Jane Doe"
+        group_entry = MagicMock()
+        group_entry.cn = "staff"
+
+        def connection(server, user=None, password=None, **kwargs):
+            conn = MagicMock(bound=True)
+            conn.bind.return_value = password != "wrong"
+
+            def search(base_dn, search_filter, **kw):
+                conn.entries = [group_entry] if "member=" in search_filter else [user_entry]
+
+            conn.search.side_effect = search
+            return conn
+
+        module.Connection.side_effect = connection
+        with patch("croom.security.sso.ldap3", module), \
+                patch("croom.security.sso.LDAP3_AVAILABLE", True):
+            yield module
+
+    def _authenticator(self):
+        from croom.security.sso import LDAPAuthenticator, LDAPConfig
+
+        return LDAPAuthenticator(LDAPConfig(
+            server="ldap.example.com",
+            bind_dn="cn=svc,dc=example,dc=com",
+            bind_password="svc-secret",
+            base_dn="dc=example,dc=com",
+        ))
+
+    async def test_authenticate(self, ldap3):
+        """Test a valid login returns the user with their groups."""
+        user = await self._authenticator().authenticate("jdoe", "password")
+
+        assert user is not None
+        assert user.user_id == "jdoe"
+        assert user.email == "jdoe@example.com"
+        assert user.groups == ["staff"]
+
+    async def test_wrong_password(self, ldap3):
+        """Test a rejected user bind fails authentication."""
+        assert await self._authenticator().authenticate("jdoe", "wrong") is None
+
+    async def test_service_connection_reused(self, ldap3):
+        """Test logins share one service connection and TLS precedes bind."""
+        authenticator = self._authenticator()
+
+        await authenticator.authenticate("jdoe", "password")
+        await authenticator.authenticate("jdoe", "password")
+
+        users = [call.kwargs["user"] for call in ldap3.Connection.call_args_list]
+        assert users == [
+            "cn=svc,dc=example,dc=com",
+            "uid=jdoe,dc=example,dc=com",
+            "uid=jdoe,dc=example,dc=com",
+        ]
+
+        service_conn = authenticator._search_conn
+        assert service_conn.method_calls[:3] == [
+            ("open", (), {}), ("start_tls", (), {}), ("bind", (), {}),
+        ]
+
+        await authenticator.aclose()
+        service_conn.unbind.assert_called_once()
+        assert authenticator._search_conn is None
+
+    async def test_runs_off_event_loop(self, ldap3):
+        """Test blocking LDAP calls run in a worker thread."""
+        import threading
+
+        authenticator = self._authenticator()
+        loop_thread = threading.get_ident()
+        seen = []
+        original = authenticator._authenticate_sync
+
+        def record(*args):
+            seen.append(threading.get_ident())
+            return original(*args)
+
+        with patch.object(authenticator, "_authenticate_sync", side_effect=record):
+            assert await authenticator.authenticate("jdoe", "password") is not None
+
+        assert seen and seen[0] != loop_thread
+
+    async def test_ldap3_unavailable(self):
+        """Test authentication is refused when ldap3 is not installed."""
+        with patch("croom.security.sso.LDAP3_AVAILABLE", False):
+            authenticator = self._authenticator()
+
+        assert await authenticator.authenticate("jdoe", "password") is None
+
+
+class TestSSOService:
+    """Tests for the multi-authenticator SSO service."""
+
+    def test_map_groups_to_roles(self):
+        """Test roles are the deduplicated union over mapped groups."""
+        from croom.security.sso import SSOService
+
+        service = SSOService()
+        mapping = {"staff": ["viewer"], "admins": ["admin", "viewer"]}
+        service.set_group_role_mapping(mapping)
+        mapping["staff"].append("mutated")
+
+        roles = service._map_groups_to_roles(["staff", "admins", "unknown"])
+        assert sorted(roles) == ["admin", "viewer"]
+        assert service._map_groups_to_roles([]) == []
+
+    def test_default_dispatch(self):
+        """Test calls without a name go to the current default authenticator."""
+        from croom.security.sso import OIDCConfig, SSOService
+
+        service = SSOService()
+        config = OIDCConfig(
+            client_id="croom",
+            client_secret="secret",
+            issuer="https://idp.example.com",
+            authorization_endpoint="https://idp.example.com/authorize",
+        )
+        service.register_oidc("first", config, default=True)
+        service.register_oidc("second", config)
+
+        assert service.get_login_url().startswith("https://idp.example.com/authorize?")
+        assert service.get_login_url("missing") is None
+
+        service.register_oidc("first", config)
+        assert service._default_auth_obj is service._authenticators["first"]
+
+    async def test_process_callback_unknown(self):
+        """Test callbacks for unregistered authenticators are rejected."""
+        from croom.security.sso import SSOService
+
+        assert await SSOService().process_callback("missing", {}) is None
+        assert await SSOService().authenticate_ldap("user", "pw") is None
+
+
+class TestSSOUser:
+    """Tests for SSO user serialization."""
+
+    def test_to_dict(self):
+        """Test the dict form carries the provider value and no session ID."""
+        from croom.security.sso import SSOProvider, SSOUser
+
+        user = SSOUser(user_id="u1", email="u1@example.com", provider=SSOProvider.OIDC,
+                       session_id="sess")
+        data = user.to_dict()
+
+        assert data["provider"] == "oidc"
+        assert "session_id" not in data
+        assert not hasattr(user, "__dict__")
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dump_users_json(self, use_orjson):
+        """Test bulk serialization matches to_dict with either encoder."""
+        import json
+
+        from croom.security import sso
+
+        if use_orjson and not sso.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        users = [
+            sso.SSOUser(user_id="u1", email="u1@example.com", groups=["staff"],
+                        provider=sso.SSOProvider.SAML, session_id="sess"),
+            sso.SSOUser(user_id="u2", email="u2@example.com"),
+        ]
+        with patch.object(sso, "ORJSON_AVAILABLE", use_orjson):
+            encoded = sso.SSOService.dump_users_json(users)
+
+        assert json.loads(encoded) == [user.to_dict() for user in users]
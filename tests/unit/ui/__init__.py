@@ -0,0 +1 @@
+"""UI module tests."""
@@ -0,0 +1,435 @@
+"""
+Tests for croom.ui.ir_remote module.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+async def lircd(tmp_path):
+    """Run a fake lircd on a UNIX socket; yields (path, list of client writers)."""
+    path = str(tmp_path / "lircd")
+    clients = []
+
+    async def on_connect(reader, writer):
+        clients.append(writer)
+
+    server = await asyncio.start_unix_server(on_connect, path=path)
+    yield path, clients
+    for writer in clients:
+        writer.close()
+    server.close()
+    await server.wait_closed()
+
+
+async def _connected_client(path, clients, timeout=0.5):
+    from croom.ui.ir_remote import LIRCClient
+
+    client = LIRCClient(path, timeout=timeout)
+    assert await client.connect() is True
+    while not clients:
+        await asyncio.sleep(0)
+    return client, clients[0]
+
+
+class TestLIRCClient:
+    """Tests for the LIRC socket client."""
+
+    async def test_read_key(self, lircd):
+        """Test a LIRC line is parsed into key, remote and repeat count."""
+        client, server = await _connected_client(*lircd)
+
+        server.write(b"0000000000e0e006 0a KEY_UP Samsung_TV\n")
+        await server.drain()
+
+        assert await client.read_key() == ("KEY_UP", "Samsung_TV", 10)
+        await client.disconnect()
+        assert client.is_connected is False
+
+    async def test_malformed_line(self, lircd):
+        """Test lines without all four LIRC fields are skipped."""
+        client, server = await _connected_client(*lircd)
+
+        server.write(b"0000000000e0e006 00 KEY_UP\n0000000000e0e006 00 KEY_OK Sony\r\n")
+        await server.drain()
+
+        assert await client.read_key() is None
+        assert await client.read_key() == ("KEY_OK", "Sony", 0)
+        await client.disconnect()
+
+    async def test_read_raw_key(self, lircd):
+        """Test the raw reader leaves key and remote names as bytes."""
+        client, server = await _connected_client(*lircd)
+
+        server.write(b"0000000000e0e006 01 KEY_DOWN LG\n")
+        await server.drain()
+
+        assert await client.read_raw_key() == (b"KEY_DOWN", b"LG", 1)
+        await client.disconnect()
+
+    async def test_read_timeout(self, lircd):
+        """Test reads return None when no key arrives in time."""
+        client, _ = await _connected_client(*lircd, timeout=0.01)
+
+        assert await client.read_key() is None
+        await client.disconnect()
+
+    async def test_server_closed(self, lircd):
+        """Test end of stream is reported as a reset connection."""
+        client, server = await _connected_client(*lircd)
+
+        server.close()
+
+        with pytest.raises(ConnectionResetError):
+            await client.read_key()
+        await client.disconnect()
+
+    async def test_missing_socket(self, tmp_path):
+        """Test connecting fails cleanly when lircd is not running."""
+        from croom.ui.ir_remote import LIRCClient
+
+        assert await LIRCClient(str(tmp_path / "missing")).connect() is False
+
+
+class TestIRRemoteService:
+    """Tests for IR key mapping and listener dispatch."""
+
+    async def test_dispatch_sync_and_async(self):
+        """Test mapped keys reach both plain and coroutine listeners."""
+        from croom.ui.ir_remote import IRAction, IRRemoteService
+
+        service = IRRemoteService()
+        calls = []
+
+        async def on_up_async(action, repeat):
+            calls.append(("async", action, repeat))
+
+        service.add_listener(IRAction.UP, lambda action, repeat: calls.append(("sync", action, repeat)))
+        service.add_listener(IRAction.UP, on_up_async)
+
+        await service._handle_key(b"KEY_UP", 0)
+
+        assert calls == [("sync", IRAction.UP, 0), ("async", IRAction.UP, 0)]
+
+    async def test_unmapped_key_ignored(self):
+        """Test keys missing from the keymap dispatch nothing."""
+        from croom.ui.ir_remote import IRRemoteService
+
+        service = IRRemoteService()
+        calls = []
+        service.add_global_listener(lambda action, repeat: calls.append(action))
+
+        await service._handle_key(b"KEY_NOT_MAPPED", 0)
+
+        assert calls == []
+
+    async def test_unmapped_key_logging(self, caplog):
+        """Test only keys known to some keymap are reported as unmapped."""
+        import logging
+
+        from croom.ui.ir_remote import IRAction, IRKeymap, IRRemoteService
+
+        service = IRRemoteService()
+        service.add_custom_keymap(IRKeymap(name="Hotel", remote_type="hotel", mappings={"KEY_TV": IRAction.HOME}))
+
+        with caplog.at_level(logging.DEBUG, logger="croom.ui.ir_remote"):
+            await service._handle_key(b"KEY_SELECT", 0)
+            await service._handle_key(b"KEY_TV", 0)
+            await service._handle_key(b"\xffGARBAGE", 0)
+
+        assert [r.getMessage() for r in caplog.records] == [
+            "Unmapped IR key: KEY_SELECT",
+            "Unmapped IR key: KEY_TV",
+        ]
+
+    async def test_keymap_change(self):
+        """Test switching keymaps changes which keys are recognised."""
+        from croom.ui.ir_remote import IRAction, IRRemoteService
+
+        service = IRRemoteService()
+        calls = []
+        service.add_listener(IRAction.OK, lambda action, repeat: calls.append(action))
+
+        await service._handle_key(b"KEY_SELECT", 0)
+        assert service.set_keymap_by_name("sony") is True
+        await service._handle_key(b"KEY_SELECT", 0)
+
+        assert calls == [IRAction.OK]
+
+    def test_keymap_lookup(self):
+        """Test custom keymaps shadow built-ins and unknown names are rejected."""
+        from croom.ui.ir_remote import IRAction, IRKeymap, IRRemoteService
+
+        service = IRRemoteService()
+        custom = IRKeymap(name="My LG", remote_type="lg", mappings={"KEY_X": IRAction.OK})
+        service.add_custom_keymap(custom)
+
+        assert service.set_keymap_by_name("lg") is True
+        assert service._keymap is custom
+        assert service.set_keymap_by_name("unknown") is False
+        assert service._keymap is custom
+
+    def test_builtin_keymaps_read_only(self):
+        """Test built-in keymap tables cannot be modified."""
+        from croom.ui.ir_remote import BUILTIN_KEYMAPS, IRAction
+
+        with pytest.raises(TypeError):
+            BUILTIN_KEYMAPS["samsung"].mappings["KEY_X"] = IRAction.OK
+
+    def test_load_keymap_from_file(self, tmp_path):
+        """Test JSON keymaps are loaded and registered as custom keymaps."""
+        from croom.ui.ir_remote import IRAction, IRRemoteService
+
+        path = tmp_path / "keymap.json"
+        path.write_bytes(
+            b'{"name": "Hotel TV", "remote_type": "hotel", "repeat_rate": 50,'
+            b' "mappings": {"KEY_OK": "ok", "KEY_MIC": "toggle_mic"}}'
+        )
+        service = IRRemoteService()
+
+        keymap = service.load_keymap_from_file(str(path))
+
+        assert keymap.mappings == {"KEY_OK": IRAction.OK, "KEY_MIC": IRAction.TOGGLE_MIC}
+        assert keymap.repeat_rate == 50
+        assert service.set_keymap_by_name("hotel") is True
+
+    def test_load_keymap_unknown_action(self, tmp_path):
+        """Test keymaps naming unknown actions are rejected."""
+        from croom.ui.ir_remote import IRRemoteService
+
+        path = tmp_path / "keymap.json"
+        path.write_bytes(b'{"mappings": {"KEY_OK": "launch_rocket"}}')
+
+        assert IRRemoteService().load_keymap_from_file(str(path)) is None
+
+    async def test_removed_listener(self):
+        """Test removed listeners are no longer called."""
+        from croom.ui.ir_remote import IRAction, IRRemoteService
+
+        service = IRRemoteService()
+        calls = []
+
+        def listener(action, repeat):
+            calls.append(action)
+
+        service.add_listener(IRAction.DOWN, listener)
+        service.remove_listener(IRAction.DOWN, listener)
+        service.remove_listener(IRAction.DOWN, listener)
+        await service._handle_key(b"KEY_DOWN", 0)
+
+        assert calls == []
+
+    async def test_removed_bound_method_listener(self):
+        """Test bound methods can be removed through a fresh attribute access."""
+        from croom.ui.ir_remote import IRAction, IRRemoteService
+
+        class Handler:
+            def __init__(self):
+                self.calls = []
+
+            def on_ok(self, action, repeat):
+                self.calls.append(action)
+
+        service = IRRemoteService()
+        handler = Handler()
+        service.add_listener(IRAction.OK, handler.on_ok)
+        service.remove_listener(IRAction.OK, handler.on_ok)
+        service.remove_listener(IRAction.MENU, handler.on_ok)
+        await service._handle_key(b"KEY_ENTER", 0)
+
+        assert handler.calls == []
+
+    async def test_repeat_filtering(self):
+        """Test repeats honour the keymap's delay and rate in milliseconds."""
+        from unittest.mock import patch
+
+        from croom.ui.ir_remote import IRAction, IRKeymap, IRRemoteService
+
+        keymap = IRKeymap("Test", "test", {"KEY_UP": IRAction.UP}, repeat_delay=200, repeat_rate=100)
+        service = IRRemoteService(keymap=keymap)
+        repeats = []
+        service.add_listener(IRAction.UP, lambda action, repeat: repeats.append(repeat))
+
+        ms = 1_000_000
+        with patch("croom.ui.ir_remote.monotonic_ns") as clock:
+            for now, repeat in ((0, 0), (150, 1), (210, 2), (260, 3), (320, 4)):
+                clock.return_value = now * ms
+                await service._handle_key(b"KEY_UP", repeat)
+
+        assert repeats == [0, 1, 2]
+
+
+    async def test_read_loop_until_disconnect(self, lircd):
+        """Test the read loop dispatches keys and stops when lircd goes away."""
+        from croom.ui.ir_remote import IRAction, IRRemoteService
+
+        path, clients = lircd
+        service = IRRemoteService(lirc_socket=path)
+        received = asyncio.Queue()
+        service.add_global_listener(lambda action, repeat: received.put_nowait(action))
+
+        assert await service.start() is True
+        while not clients:
+            await asyncio.sleep(0)
+        clients[0].write(b"0000000000e0e006 00 KEY_UP S\n0000000000e0e006 00 KEY_DOWN S\n")
+        await clients[0].drain()
+
+        assert await asyncio.wait_for(received.get(), 1) == IRAction.UP
+        assert await asyncio.wait_for(received.get(), 1) == IRAction.DOWN
+
+        clients[0].close()
+        while service._running:
+            await asyncio.sleep(0.01)
+        assert service._lirc.is_connected is False
+
+
+    async def test_global_listener(self):
+        """Test global listeners run after action listeners and can be removed."""
+        from croom.ui.ir_remote import IRAction, IRRemoteService
+
+        service = IRRemoteService()
+        calls = []
+
+        def on_any(action, repeat):
+            calls.append(("global", action))
+
+        service.add_global_listener(on_any)
+        service.add_listener(IRAction.HOME, lambda action, repeat: calls.append(("home", action)))
+
+        await service._handle_key(b"KEY_HOME", 0)
+        service.remove_global_listener(on_any)
+        await service._handle_key(b"KEY_HOME", 0)
+
+        assert calls == [("home", IRAction.HOME), ("global", IRAction.HOME), ("home", IRAction.HOME)]
+
+    async def test_single_shot_actions_ignore_repeats(self):
+        """Test held keys for press-once actions dispatch only the first press."""
+        from unittest.mock import patch
+
+        from croom.ui.ir_remote import IRAction, IRRemoteService
+
+        service = IRRemoteService()
+        calls = []
+        service.add_global_listener(lambda action, repeat: calls.append((action, repeat)))
+
+        with patch("croom.ui.ir_remote.monotonic_ns", side_effect=[0, 10**9, 2 * 10**9]):
+            await service._handle_key(b"KEY_ENTER", 0)
+            await service._handle_key(b"KEY_ENTER", 1)
+            await service._handle_key(b"KEY_UP", 0)
+            await service._handle_key(b"KEY_UP", 1)
+
+        assert calls == [(IRAction.OK, 0), (IRAction.UP, 0), (IRAction.UP, 1)]
+
+
+    async def test_stop_cancels_read_loop(self, lircd):
+        """Test stop() cancels the idle read loop and disconnects."""
+        from croom.ui.ir_remote import IRRemoteService
+
+        path, _ = lircd
+        service = IRRemoteService(lirc_socket=path)
+
+        assert await service.start() is True
+        task = service._task
+        await asyncio.sleep(0)
+        await service.stop()
+
+        assert task.done()
+        assert service._task is None
+        assert service._lirc.is_connected is False
+
+
+    async def test_read_loop_socket_error(self, lircd):
+        """Test socket errors stop the service so start() can reconnect."""
+        from unittest.mock import AsyncMock, patch
+
+        from croom.ui.ir_remote import IRRemoteService, LIRCClient
+
+        service = IRRemoteService(lirc_socket=lircd[0])
+
+        with patch.object(LIRCClient, "read_raw_key", AsyncMock(side_effect=BrokenPipeError())):
+            assert await service.start() is True
+            await service._task
+
+        assert service._running is False
+        assert service._lirc.is_connected is False
+        assert await service.start() is True
+        await service.stop()
+
+    async def test_stop_after_read_loop_failure(self, lircd):
+        """Test stop() does not re-raise an error that ended the read loop."""
+        from unittest.mock import AsyncMock, patch
+
+        from croom.ui.ir_remote import IRRemoteService, LIRCClient
+
+        service = IRRemoteService(lirc_socket=lircd[0])
+
+        with patch.object(LIRCClient, "read_raw_key", AsyncMock(side_effect=RuntimeError("boom"))):
+            assert await service.start() is True
+            await asyncio.wait([service._task])
+
+        await service.stop()
+        assert service._lirc.is_connected is False
+
+
+class TestIRNavigationHandler:
+    """Tests for IR navigation events sent to QML."""
+
+    def _handler(self):
+        from unittest.mock import MagicMock
+
+        from croom.ui.ir_remote import IRNavigationHandler, IRRemoteService
+
+        service = IRRemoteService()
+        handler = IRNavigationHandler(service)
+        bridge = MagicMock()
+        handler.set_qml_bridge(bridge)
+        return service, handler, bridge
+
+    async def test_navigation_and_digits(self):
+        """Test arrows and number keys produce QML events."""
+        service, _, bridge = self._handler()
+
+        await service._handle_key(b"KEY_LEFT", 0)
+        await service._handle_key(b"KEY_7", 0)
+
+        events = [call.args for call in bridge.send_ir_event.call_args_list]
+        assert events == [("navigate", {"direction": "left"}), ("number", {"digit": 7})]
+
+    async def test_payloads_are_shared(self):
+        """Test repeated presses reuse the same read-only payload."""
+        service, _, bridge = self._handler()
+
+        await service._handle_key(b"KEY_VOLUMEUP", 0)
+        await service._handle_key(b"KEY_VOLUMEUP", 0)
+
+        first, second = (call.args[1] for call in bridge.send_ir_event.call_args_list)
+        assert first is second
+        with pytest.raises(TypeError):
+            first["direction"] = "down"
+
+    async def test_disabled(self):
+        """Test no events are sent while navigation is disabled."""
+        service, handler, bridge = self._handler()
+        handler.set_enabled(False)
+
+        await service._handle_key(b"KEY_UP", 0)
+
+        bridge.send_ir_event.assert_not_called()
+
+        handler.set_enabled(True)
+        await service._handle_key(b"KEY_UP", 0)
+
+        bridge.send_ir_event.assert_called_once_with("navigate", {"direction": "up"})
+
+    async def test_no_bridge(self):
+        """Test events are dropped until a QML bridge is set."""
+        from croom.ui.ir_remote import IRNavigationHandler, IRRemoteService
+
+        service = IRRemoteService()
+        handler = IRNavigationHandler(service)
+
+        await service._handle_key(b"KEY_MUTE", 0)
+        handler.set_qml_bridge(None)
+        await service._handle_key(b"KEY_MUTE", 0)